@@ -5,10 +5,17 @@ import json
 import csv
 import logging
 import re
+import atexit
+import random
+import threading
+import orjson
+import ijson
 import requests
 from bs4 import BeautifulSoup
 from tkinter import Tk, filedialog, messagebox
 from urllib.parse import urljoin, urlparse, parse_qs
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 import pandas as pd
 
@@ -26,6 +33,48 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Debug dumps are written by a single background thread so disk I/O stays off the request path
+_DEBUG_EXEC = ThreadPoolExecutor(max_workers=1, thread_name_prefix='propstream-debug')
+atexit.register(_DEBUG_EXEC.shutdown, wait=True)
+
+def _write_debug(path, content):
+    """Write a debug dump to disk, as raw bytes when given bytes"""
+    try:
+        if isinstance(content, bytes):
+            with open(path, "wb") as f:
+                f.write(content)
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(content)
+    except Exception as e:
+        logger.warning(f"Error writing debug file {path}: {str(e)}")
+
+def _dump(path, content):
+    """Queue a debug dump for the background writer"""
+    _DEBUG_EXEC.submit(_write_debug, path, content)
+
+def _write_debug_json(path, obj):
+    """Serialize an object as indented JSON straight into a binary debug file"""
+    try:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    except Exception as e:
+        logger.warning(f"Error writing debug file {path}: {str(e)}")
+
+def _dump_json(path, obj):
+    """Queue a JSON debug dump, serializing it on the background writer rather than the caller"""
+    _DEBUG_EXEC.submit(_write_debug_json, path, obj)
+
+def _sleep_backoff(attempt, base=2.0, cap=60.0):
+    """Sleep for an exponentially growing, jittered delay and return it"""
+    delay = min(cap, base * (2 ** attempt)) + random.uniform(0, 0.5)
+    logger.info("Backing off %.1f seconds before retrying...", delay)
+    time.sleep(delay)
+    return delay
+
+# Groups catalogs larger than this are parsed incrementally instead of loaded whole
+_GROUPS_STREAM_THRESHOLD = 200 * 1024
+
 class PropStreamHTMLScraper:
     def __init__(self):
         # Get credentials from environment variables
@@ -36,6 +85,14 @@ class PropStreamHTMLScraper:
         self.session = requests.Session()
         self.scraped_data = []
         self.uploaded_file_path = None  # Store the path to the uploaded file
+        self._groups_cache = None  # (fetched_at, index) for the contact groups catalog
+        self._io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='propstream-io')  # Overlaps independent requests
+        self._io_local = threading.local()  # Each I/O pool thread gets its own Session, since Session is not thread-safe
+        self._io_sessions = []
+        self._io_sessions_lock = threading.Lock()
+        self._cookie_lock = threading.Lock()  # Guards copying cookies between the main and I/O pool sessions
+        self.debug_dump = os.environ.get("PROPSTREAM_DEBUG_DUMP") == "1"  # Save every contact list attempt to disk
+        self._contact_list_url_tmpl = self.base_url + "/api/contacts?groupId={gid}&page=1&pageSize=100&t={ts}"
         self.setup_session()
         
     def setup_session(self):
@@ -44,11 +101,44 @@ class PropStreamHTMLScraper:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/134.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
             'Accept-Language': 'en-US,en;q=0.9',
+            'Accept-Encoding': 'gzip, deflate, br',  # br is decoded by urllib3 when brotli is installed
             'Origin': self.base_url,
             'Referer': self.base_url,
         })
         logger.info("Session initialized with headers")
     
+    def _io_session(self):
+        """Return this I/O pool thread's own Session, re-synced with the main session's headers and cookies"""
+        session = getattr(self._io_local, "session", None)
+        if session is None:
+            session = requests.Session()
+            self._io_local.session = session
+            with self._io_sessions_lock:
+                self._io_sessions.append(session)
+        with self._cookie_lock:
+            session.headers.update(self.session.headers)
+            # Replace the jar outright so cookies the main session dropped or refreshed are not kept
+            session.cookies = self.session.cookies.copy()
+        return session
+    
+    def _pooled_get(self, url, **kwargs):
+        """GET a URL from an I/O pool thread, copying every cookie it sets back to the main session"""
+        response = self._io_session().get(url, **kwargs)
+        # Redirect hops can set cookies too (a refreshed auth or CSRF token), so merge the whole chain
+        with self._cookie_lock:
+            for hop in (*response.history, response):
+                self.session.cookies.update(hop.cookies)
+        return response
+    
+    def close(self):
+        """Stop the I/O pool and close every session"""
+        self._io_pool.shutdown(wait=True)
+        with self._io_sessions_lock:
+            for session in self._io_sessions:
+                session.close()
+            self._io_sessions.clear()
+        self.session.close()
+    
     def login(self):
         """Login to PropStream"""
         try:
@@ -699,23 +789,11 @@ class PropStreamHTMLScraper:
                                 f.write(json.dumps(contacts_data, indent=2))
                             
                             # Try different possible response structures
-                            if 'items' in contacts_data:
-                                contact_count = len(contacts_data['items'])
+                            contact_count, contact_items = self._extract_count_and_items(contacts_data)
+                            if contact_items is not None:
                                 # Log each contact for debugging
-                                for i, contact in enumerate(contacts_data['items']):
+                                for i, contact in enumerate(contact_items):
                                     logger.info(f"Contact {i+1}: {contact.get('name', 'Unknown')}")
-                            elif 'contacts' in contacts_data:
-                                contact_count = len(contacts_data['contacts'])
-                                # Log each contact for debugging
-                                for i, contact in enumerate(contacts_data['contacts']):
-                                    logger.info(f"Contact {i+1}: {contact.get('name', 'Unknown')}")
-                            elif isinstance(contacts_data, list):
-                                contact_count = len(contacts_data)
-                                # Log each contact for debugging
-                                for i, contact in enumerate(contacts_data):
-                                    logger.info(f"Contact {i+1}: {contact.get('name', 'Unknown')}")
-                            elif 'count' in contacts_data:
-                                contact_count = contacts_data['count']
                             
                             logger.info(f"Found {contact_count} contacts in the group")
                     except Exception as e:
@@ -953,20 +1031,13 @@ class PropStreamHTMLScraper:
                                 
                                 # Process the JSON data
                                 if isinstance(grid_data, list):
-                                    for row in grid_data:
-                                        contact_id = row.get('id')
-                                        if contact_id:
-                                            contact_ids.append(contact_id)
-                                elif 'rows' in grid_data:
-                                    for row in grid_data['rows']:
-                                        contact_id = row.get('id')
-                                        if contact_id:
-                                            contact_ids.append(contact_id)
-                                elif 'data' in grid_data:
-                                    for row in grid_data['data']:
-                                        contact_id = row.get('id')
-                                        if contact_id:
-                                            contact_ids.append(contact_id)
+                                    rows = grid_data
+                                elif (rows := grid_data.get('rows')) is None:
+                                    rows = grid_data.get('data') or []
+                                for row in rows:
+                                    contact_id = row.get('id')
+                                    if contact_id:
+                                        contact_ids.append(contact_id)
                                             
                                 if contact_ids:
                                     logger.info(f"Found {len(contact_ids)} contact IDs from grid data JSON")
@@ -1582,12 +1653,7 @@ class PropStreamHTMLScraper:
                     list_data = list_contacts_response.json()
                     
                     # Handle different response formats
-                    if 'items' in list_data:
-                        contact_items = list_data['items']
-                    elif 'contacts' in list_data:
-                        contact_items = list_data['contacts']
-                    elif isinstance(list_data, list):
-                        contact_items = list_data
+                    contact_items = self._extract_count_and_items(list_data)[1] or []
                         
                     logger.info(f"Found {len(contact_items)} contacts in the list")
                     
@@ -2171,6 +2237,8 @@ class PropStreamHTMLScraper:
             import traceback
             logger.critical(traceback.format_exc())
             return False
+        finally:
+            self.close()
     
     def navigate_to_groups_ui(self, group_name=None):
         """Navigate to the groups section in the PropStream UI using the CSS selectors provided by the user"""
@@ -2186,7 +2254,7 @@ class PropStreamHTMLScraper:
                 return None
                 
             # Parse the contacts page
-            soup = BeautifulSoup(contacts_response.text, 'html.parser')
+            soup = BeautifulSoup(contacts_response.content, 'lxml')
             
             # Step 2: Look for the Groups dropdown
             # Use the CSS selectors provided by the user
@@ -2238,6 +2306,34 @@ class PropStreamHTMLScraper:
             logger.error(f"Error navigating to groups UI: {str(e)}")
             return None
     
+    def _probe_url(self, url):
+        """Check a URL without downloading its body, falling back to a streamed GET if HEAD is not allowed"""
+        response = self.session.head(url, allow_redirects=True)
+        if response.status_code == 405:
+            response = self.session.get(url, stream=True)
+            response.close()
+        return response
+    
+    def bulk_add_contacts(self, group_id, contact_ids, chunk_size=500):
+        """Add contacts to a group in chunks, returning True if every chunk was accepted"""
+        add_contacts_url = f"{self.base_url}/api/contact-groups/{group_id}/add-contacts"
+        alt_add_url = f"{self.base_url}/api/contacts/groups/{group_id}/contacts"
+        
+        for i in range(0, len(contact_ids), chunk_size):
+            chunk = contact_ids[i:i + chunk_size]
+            add_contacts_response = self.session.post(add_contacts_url, json={"contactIds": chunk})
+            logger.info(f"Add contacts response ({len(chunk)} contacts): {add_contacts_response.status_code}")
+            
+            # If the add-contacts endpoint rejects the chunk, try the alternative endpoint
+            if add_contacts_response.status_code not in [200, 201, 202]:
+                alt_add_response = self.session.post(alt_add_url, json={"ids": chunk})
+                logger.info(f"Alternative add contacts response ({len(chunk)} contacts): {alt_add_response.status_code}")
+                
+                if alt_add_response.status_code not in [200, 201, 202]:
+                    return False
+        
+        return True
+    
     def create_group_directly(self, group_name, contact_ids=None):
         """Create a group directly using the UI interaction pattern"""
         try:
@@ -2277,11 +2373,15 @@ class PropStreamHTMLScraper:
                 else:
                     create_response = alt_create_response
             
+            # The groups catalog changed, so drop any cached index
+            self._invalidate_groups_cache()
+            
             # Try to extract the group ID from the response
             group_id = None
+            body = create_response.content
             try:
                 if create_response.headers.get('Content-Type', '').startswith('application/json'):
-                    response_data = create_response.json()
+                    response_data = orjson.loads(body)
                     group_id = response_data.get('id') or response_data.get('groupId')
                     
                     if not group_id and 'data' in response_data:
@@ -2291,12 +2391,12 @@ class PropStreamHTMLScraper:
             except Exception as e:
                 logger.warning(f"Error extracting group ID from create response: {str(e)}")
             
-            # If we still don't have a group ID, try to extract it from the response text
+            # If we still don't have a group ID, try to extract it from the raw response bytes
             if not group_id:
                 try:
-                    id_match = re.search(r'"id"[:\s]+"([^"]+)"', create_response.text)
+                    id_match = re.search(rb'"id"[:\s]+"([^"]+)"', body)
                     if id_match:
-                        group_id = id_match.group(1)
+                        group_id = id_match.group(1).decode('utf-8', 'replace')
                         logger.info(f"Extracted group ID from create response text: {group_id}")
                 except Exception as e:
                     logger.warning(f"Error extracting group ID from create response text: {str(e)}")
@@ -2307,36 +2407,24 @@ class PropStreamHTMLScraper:
             # If we have a group ID and contact IDs, add the contacts to the group
             if group_id and contact_ids:
                 try:
-                    # Method 1: Add contacts via the add-contacts endpoint
-                    add_contacts_url = f"{self.base_url}/api/contact-groups/{group_id}/add-contacts"
-                    add_contacts_data = {
-                        "contactIds": contact_ids
-                    }
-                    add_contacts_response = self.session.post(add_contacts_url, json=add_contacts_data)
-                    logger.info(f"Add contacts response: {add_contacts_response.status_code}")
-                    
-                    # Method 2: If method 1 fails, try another endpoint
-                    if add_contacts_response.status_code not in [200, 201, 202]:
-                        alt_add_url = f"{self.base_url}/api/contacts/groups/{group_id}/contacts"
-                        alt_add_response = self.session.post(alt_add_url, json={"ids": contact_ids})
-                        logger.info(f"Alternative add contacts response: {alt_add_response.status_code}")
-                        
-                        # Method 3: If method 2 fails, try updating the group with contacts
-                        if alt_add_response.status_code not in [200, 201, 202]:
-                            update_group_url = f"{self.base_url}/api/contact-groups/{group_id}"
-                            update_group_data = {
-                                "name": group_name,
-                                "contactIds": contact_ids
-                            }
-                            update_response = self.session.put(update_group_url, json=update_group_data)
-                            logger.info(f"Update group with contacts response: {update_response.status_code}")
+                    # Methods 1 and 2: Add contacts in chunks via the add-contacts endpoints
+                    if not self.bulk_add_contacts(group_id, contact_ids):
+                        # Method 3: If both fail, try updating the group with contacts
+                        update_group_url = f"{self.base_url}/api/contact-groups/{group_id}"
+                        update_group_data = {
+                            "name": group_name,
+                            "contactIds": contact_ids
+                        }
+                        update_response = self.session.put(update_group_url, json=update_group_data)
+                        logger.info(f"Update group with contacts response: {update_response.status_code}")
+                        self._invalidate_groups_cache()
                 except Exception as e:
                     logger.warning(f"Error adding contacts to group: {str(e)}")
             
             # Verify the group exists
             if group_id:
                 verify_url = f"{self.base_url}/api/contact-groups/{group_id}"
-                verify_response = self.session.get(verify_url)
+                verify_response = self._probe_url(verify_url)
                 
                 if verify_response.status_code == 200:
                     logger.info(f"Successfully verified group exists: {group_name} (ID: {group_id})")
@@ -2344,37 +2432,19 @@ class PropStreamHTMLScraper:
                 else:
                     logger.warning(f"Could not verify group exists: {verify_response.status_code}")
             
-            # Attempt to refresh the UI to make the group appear
+            # Final check - look for our group in the groups index
             try:
-                # Force the UI to refresh by accessing the contacts page again
-                refresh_url = f"{self.base_url}/contacts"
-                refresh_params = {"refresh": "true", "t": int(time.time())}
-                refresh_response = self.session.get(refresh_url, params=refresh_params)
-                logger.info(f"Refresh contacts page response: {refresh_response.status_code}")
+                listed_group_id = self._get_groups_index()['exact'].get(group_name.lower())
+                if listed_group_id:
+                    logger.info(f"Found group in groups list: {group_name} (ID: {listed_group_id})")
+                    return listed_group_id
             except Exception as e:
-                logger.warning(f"Error refreshing contacts page: {str(e)}")
-            
-            # Final check - list all groups and look for our group
-            groups_url = f"{self.base_url}/api/contact-groups"
-            groups_response = self.session.get(groups_url)
-            
-            if groups_response.status_code == 200:
-                try:
-                    groups_data = groups_response.json()
-                    for group in groups_data:
-                        if group.get('name') == group_name:
-                            group_id = group.get('id')
-                            logger.info(f"Found group in groups list: {group_name} (ID: {group_id})")
-                            return group_id
-                except Exception as e:
-                    logger.warning(f"Error checking groups list: {str(e)}")
+                logger.warning(f"Error checking groups list: {str(e)}")
             
             return group_id or f"group_{int(time.time())}"
             
         except Exception as e:
-            logger.error(f"Error creating group directly: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error creating group directly: {str(e)}")
             return None
     
     def force_create_and_display_group(self, group_name, contact_ids=None):
@@ -2382,16 +2452,7 @@ class PropStreamHTMLScraper:
         try:
             logger.info(f"Force creating group with direct UI interaction: {group_name}")
             
-            # Step 1: Navigate to contacts page with cache-busting parameter
-            timestamp = int(time.time())
-            contacts_url = f"{self.base_url}/contacts?t={timestamp}"
-            contacts_response = self.session.get(contacts_url)
-            
-            if contacts_response.status_code != 200:
-                logger.error(f"Failed to access contacts page: {contacts_response.status_code}")
-                return None
-                
-            # Step 2: Looking at the HTML structure from the user's query
+            # Looking at the HTML structure from the user's query
             # We need to mimic clicking the "+" icon next to "Groups"
             # This appears to trigger a modal/popup for creating a new group
             
@@ -2416,12 +2477,13 @@ class PropStreamHTMLScraper:
             )
             
             logger.info(f"Force create group response: {create_response.status_code}")
+            self._invalidate_groups_cache()
             
             # Try to extract the group ID
             group_id = None
             try:
                 if create_response.headers.get('Content-Type', '').startswith('application/json'):
-                    response_data = create_response.json()
+                    response_data = orjson.loads(create_response.content)
                     group_id = response_data.get('id') or response_data.get('groupId')
                     logger.info(f"Extracted group ID: {group_id}")
             except Exception as e:
@@ -2444,7 +2506,7 @@ class PropStreamHTMLScraper:
                     # Try to extract ID from response
                     if dom_response.status_code in [200, 201, 202]:
                         try:
-                            dom_result = dom_response.json()
+                            dom_result = orjson.loads(dom_response.content)
                             group_id = dom_result.get('id') or dom_result.get('elementId')
                         except Exception:
                             pass
@@ -2454,42 +2516,25 @@ class PropStreamHTMLScraper:
             # Add a delay to allow server to process the group creation
             time.sleep(5)
             
-            # Force reload the contacts page to refresh the UI
-            reload_url = f"{self.base_url}/contacts?refresh=true&t={int(time.time())}"
-            reload_response = self.session.get(reload_url)
-            logger.info(f"Force reload contacts page: {reload_response.status_code}")
-            
-            # Wait a moment for the page to fully load
-            time.sleep(3)
-            
             # Check if our group now exists
-            groups_url = f"{self.base_url}/api/contact-groups"
-            groups_response = self.session.get(groups_url)
-            
-            if groups_response.status_code == 200:
-                try:
-                    groups_data = groups_response.json()
-                    for group in groups_data:
-                        if group.get('name') == group_name:
-                            group_id = group.get('id')
-                            logger.info(f"Confirmed group exists after force creation: {group_name} (ID: {group_id})")
-                            
-                            # If we have contacts to add and a group ID, add them now
-                            if contact_ids and group_id:
-                                add_url = f"{self.base_url}/api/contact-groups/{group_id}/add-contacts"
-                                add_data = {"contactIds": contact_ids}
-                                add_response = self.session.post(add_url, json=add_data)
-                                logger.info(f"Added {len(contact_ids)} contacts to group: {add_response.status_code}")
-                            
-                            return group_id
-                except Exception as e:
-                    logger.warning(f"Error checking if group exists after force creation: {str(e)}")
+            try:
+                listed_group_id = self._get_groups_index()['exact'].get(group_name.lower())
+                if listed_group_id:
+                    group_id = listed_group_id
+                    logger.info(f"Confirmed group exists after force creation: {group_name} (ID: {group_id})")
+                    
+                    # If we have contacts to add and a group ID, add them now
+                    if contact_ids:
+                        added = self.bulk_add_contacts(group_id, contact_ids)
+                        logger.info(f"Added {len(contact_ids)} contacts to group: {'success' if added else 'failed'}")
+                    
+                    return group_id
+            except Exception as e:
+                logger.warning(f"Error checking if group exists after force creation: {str(e)}")
             
             return group_id
         except Exception as e:
-            logger.error(f"Error in force creating group: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error in force creating group: {str(e)}")
             return None
     
     def find_group_in_dropdown(self, target_name):
@@ -2506,11 +2551,10 @@ class PropStreamHTMLScraper:
                 return None
                 
             # Save for debugging
-            with open("contacts_dropdown_page.html", "w", encoding="utf-8") as f:
-                f.write(contacts_response.text)
+            _dump("contacts_dropdown_page.html", contacts_response.content)
                 
             # Parse the HTML
-            soup = BeautifulSoup(contacts_response.text, 'html.parser')
+            soup = BeautifulSoup(contacts_response.content, 'lxml')
             
             # Try multiple approaches to find the dropdown based on the exact HTML structure shown
             # Approach 1: Look for select based on class name
@@ -2564,10 +2608,9 @@ class PropStreamHTMLScraper:
                     import_response = self.session.get(import_url)
                     
                     if import_response.status_code == 200:
-                        import_soup = BeautifulSoup(import_response.text, 'html.parser')
+                        import_soup = BeautifulSoup(import_response.content, 'lxml')
                         # Save import page for debugging
-                        with open("import_contacts_page.html", "w", encoding="utf-8") as f:
-                            f.write(import_response.text)
+                        _dump("import_contacts_page.html", import_response.content)
                         
                         # Try to find select element in import page
                         import_dropdown = import_soup.select_one('select[name="name"]')
@@ -2613,66 +2656,182 @@ class PropStreamHTMLScraper:
             return None
             
         except Exception as e:
-            logger.error(f"Error finding group in dropdown: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error finding group in dropdown: {str(e)}")
             return None
     
+    def _get_groups_index(self, ttl=30):
+        """Return a cached name/ID index of all contact groups, refetching it once the TTL expires"""
+        now = time.monotonic()
+        if self._groups_cache and now - self._groups_cache[0] < ttl:
+            return self._groups_cache[1]
+        
+        groups_index = {'exact': {}, 'names': [], 'by_id': {}}
+        with self.session.get(f"{self.base_url}/api/contact-groups", stream=True) as groups_response:
+            groups_response.raise_for_status()
+            
+            # Stream large catalogs so only the name/ID pairs are kept in memory
+            if int(groups_response.headers.get('Content-Length') or 0) > _GROUPS_STREAM_THRESHOLD:
+                groups_response.raw.decode_content = True
+                groups_data = ijson.items(groups_response.raw, 'item')
+            else:
+                groups_data = orjson.loads(groups_response.content)
+            
+            for group in groups_data:
+                group_name = group.get('name', '')
+                group_id = group.get('id')
+                groups_index['exact'].setdefault(group_name.lower(), group_id)
+                groups_index['names'].append((group_name.lower(), group_id))
+                groups_index['by_id'][group_id] = group_name
+        
+        self._groups_cache = (now, groups_index)
+        return groups_index
+    
+    def _invalidate_groups_cache(self):
+        """Drop the cached groups index so the next lookup sees created or updated groups"""
+        self._groups_cache = None
+    
     def find_group_by_name(self, target_name):
         """Find a group by name using a case-insensitive search, supporting partial matches"""
         try:
             logger.info(f"Searching for group with name similar to '{target_name}'")
             
-            # First try finding the group in the dropdown - most reliable method
-            dropdown_group_id = self.find_group_in_dropdown(target_name)
-            if dropdown_group_id:
-                return dropdown_group_id
-                
-            # Get list of all groups
-            groups_url = f"{self.base_url}/api/contact-groups"
-            groups_response = self.session.get(groups_url)
-            
-            if groups_response.status_code != 200:
-                logger.warning(f"Failed to get groups list: {groups_response.status_code}")
-                return None
-                
             target_name_lower = target_name.lower()
-            best_match = None
-            best_match_id = None
-            exact_match = False
             
+            # Serve exact and partial matches from the cached groups index
             try:
-                groups_data = groups_response.json()
-                
-                # First look for exact match
-                for group in groups_data:
-                    group_name = group.get('name', '')
-                    if group_name.lower() == target_name_lower:
-                        logger.info(f"Found exact match for group: '{group_name}' with ID: {group.get('id')}")
-                        return group.get('id')
-                
-                # If no exact match, look for partial matches
-                for group in groups_data:
-                    group_name = group.get('name', '')
-                    if target_name_lower in group_name.lower():
-                        # If we find a name that contains our target, use it
-                        best_match = group_name
-                        best_match_id = group.get('id')
-                        logger.info(f"Found partial match for group: '{group_name}' with ID: {best_match_id}")
-                        break
-            except Exception as e:
-                logger.warning(f"Error parsing groups data: {str(e)}")
+                groups_index = self._get_groups_index()
+                
+                group_id = groups_index['exact'].get(target_name_lower)
+                if group_id:
+                    logger.info(f"Found exact match for group: '{groups_index['by_id'].get(group_id)}' with ID: {group_id}")
+                    return group_id
                 
-            if best_match_id:
-                logger.info(f"Using best matching group: '{best_match}' with ID: {best_match_id}")
-                return best_match_id
+                for group_name_lower, group_id in groups_index['names']:
+                    if target_name_lower in group_name_lower:
+                        logger.info(f"Found partial match for group: '{groups_index['by_id'].get(group_id)}' with ID: {group_id}")
+                        return group_id
+            except Exception as e:
+                logger.warning(f"Error getting groups list: {str(e)}")
+            
+            # Fall back to the dropdown on the contacts page
+            dropdown_group_id = self.find_group_in_dropdown(target_name)
+            if dropdown_group_id:
+                return dropdown_group_id
                 
-            # If no match found via API, try UI navigation
+            # If no match found via API or dropdown, try UI navigation
             return self.navigate_to_groups_ui(target_name)
         except Exception as e:
             logger.error(f"Error finding group by name: {str(e)}")
             return None
     
+    @staticmethod
+    def _extract_count_and_items(data):
+        """Return the contact count and contact list from any of the contact list response formats"""
+        if isinstance(data, list):
+            return len(data), data
+        if not isinstance(data, dict):
+            return 0, None
+        if (items := data.get('items')) is not None or (items := data.get('contacts')) is not None:
+            return len(items), items
+        return data.get('count', 0), None
+    
+    def _poll_contact_count(self, contact_list_urls, file_id=None, max_attempts=5):
+        """Poll the contact list URLs until one reports more than one contact, returning the last count seen
+        
+        Only URLs that failed transiently or have not returned enough contacts yet are re-issued.
+        The backoff between the 5 default attempts (2, 4, 8 and 16 seconds) gives the import
+        about 30 seconds to propagate, as the old fixed waits did.
+        """
+        contact_count = 0
+        contact_list_body = None
+        recent_bodies = deque(maxlen=3)  # Last few raw responses, only written out if the import fails
+        pending_urls = list(contact_list_urls)
+        
+        for attempt in range(max_attempts):
+            logger.info("Contact list retrieval attempt %s/%s", attempt+1, max_attempts)
+            retry_urls = []
+            
+            # Issue every pending URL at once so their round-trips overlap
+            futures = [self._io_pool.submit(self._pooled_get, url) for url in pending_urls]
+            
+            for url, future in zip(pending_urls, futures):
+                try:
+                    list_response = future.result()
+                except Exception as e:
+                    logger.warning("Error requesting contact list (%s): %s", url, e)
+                    retry_urls.append(url)
+                    continue
+                logger.info("Contact list API response (%s): %s", url, list_response.status_code)
+                
+                # Server errors are transient, so try this URL again on the next attempt
+                if list_response.status_code >= 500:
+                    retry_urls.append(url)
+                    continue
+                
+                # If successful, extract the count (saving every attempt only in debug mode)
+                if list_response.status_code == 200:
+                    if self.debug_dump:
+                        _dump(f"contact_list_api_attempt{attempt+1}.json", list_response.content)
+                    else:
+                        recent_bodies.append((f"contact_list_api_attempt{attempt+1}.json", list_response.content))
+                    
+                    # Try to extract the contact count from the response
+                    try:
+                        contact_data = orjson.loads(list_response.content)
+                        
+                        # Save full response for debugging
+                        if self.debug_dump:
+                            _dump_json(f"contact_data_raw_attempt{attempt+1}.json", contact_data)
+                        
+                        # Try different response formats
+                        contact_count, contact_items = self._extract_count_and_items(contact_data)
+                        
+                        # Save the actual contacts for inspection
+                        if self.debug_dump and contact_items is not None:
+                            _dump_json(f"contact_items_attempt{attempt+1}.json", contact_items)
+                        
+                        # If we found more than 1 contact, we can stop trying
+                        if contact_count > 1:
+                            if file_id:
+                                logger.info("IMPORTED CONTACTS COUNT: %s contacts were found in group (attempt %s)", contact_count, attempt+1)
+                                logger.info("IMPORT SOURCE: File ID: %s", file_id)
+                            else:
+                                logger.info("CONTACTS COUNT: %s contacts found in group (attempt %s)", contact_count, attempt+1)
+                            for pending in futures:
+                                pending.cancel()
+                            _dump("contact_list_api.json", list_response.content)
+                            return contact_count
+                        
+                        if contact_count == 1:
+                            contact_list_body = list_response.content
+                            logger.info("CONTACTS COUNT: 1 contact found in group (attempt %s)", attempt+1)
+                            if file_id and attempt < max_attempts - 1:
+                                logger.warning("Only 1 contact found but more were expected. Will try again after delay...")
+                        
+                        # An empty or single-contact list may still be processing
+                        retry_urls.append(url)
+                    except Exception as e:
+                        logger.warning("Error extracting contact count: %s", e)
+            
+            pending_urls = retry_urls
+            if not pending_urls:
+                logger.info("No contact list URLs left worth retrying")
+                break
+                
+            # Back off between attempts, the delay doubling with the attempt number
+            if attempt < max_attempts - 1:
+                _sleep_backoff(attempt)
+        
+        # Always keep the last contact list that returned contacts
+        if contact_list_body:
+            _dump("contact_list_api.json", contact_list_body)
+        
+        # The import could not be confirmed, so write out the buffered attempts
+        for name, body in recent_bodies:
+            _dump(name, body)
+        
+        return contact_count
+    
     def navigate_to_group_page(self, group_id, file_id=None):
         """Navigate directly to the group page to view the contacts"""
         try:
@@ -2699,8 +2858,7 @@ class PropStreamHTMLScraper:
             logger.info(f"Group page navigation response: {group_response.status_code}")
             
             # Save the response for debugging
-            with open("group_page.html", "w", encoding="utf-8") as f:
-                f.write(group_response.text)
+            _dump("group_page.html", group_response.content)
                 
             # Check for import status if file_id is available
             if file_id:
@@ -2717,13 +2875,13 @@ class PropStreamHTMLScraper:
                         logger.info(f"Import status response ({status_url}): {status_response.status_code}")
                         
                         if status_response.status_code == 200:
-                            with open("import_status.json", "w", encoding="utf-8") as f:
-                                f.write(status_response.text)
+                            status_body = status_response.content
+                            _dump("import_status.json", status_body)
                             
                             # Try to parse the status
                             try:
-                                status_data = status_response.json()
-                                logger.info(f"Import status: {json.dumps(status_data, indent=2)}")
+                                status_data = orjson.loads(status_body)
+                                logger.info(f"Import status: {orjson.dumps(status_data, option=orjson.OPT_INDENT_2).decode()}")
                                 
                                 # Check for important status fields
                                 status = status_data.get('status')
@@ -2775,14 +2933,13 @@ class PropStreamHTMLScraper:
                     direct_response = self.session.get(direct_url)
                     logger.info(f"Direct URL group page navigation response: {direct_response.status_code}")
                     
-                    with open("direct_group_page.html", "w", encoding="utf-8") as f:
-                        f.write(direct_response.text)
+                    _dump("direct_group_page.html", direct_response.content)
             
-            # Force browser to reload the page by adding a timestamp
+            # Force browser to reload the page by adding a timestamp, letting the
+            # request run on the I/O pool during the processing delay below
             timestamp = int(time.time())
             reload_url = f"{self.base_url}/contact/{group_id}?t={timestamp}"
-            reload_response = self.session.get(reload_url)
-            logger.info(f"Forced reload of group page response: {reload_response.status_code}")
+            reload_future = self._io_pool.submit(self._pooled_get, reload_url, stream=True)
             
             # Make multiple attempts to get the updated contact count with different API formats
             logger.info("Making multiple attempts to get updated contact count...")
@@ -2790,13 +2947,20 @@ class PropStreamHTMLScraper:
             # Add a delay between API calls to allow for processing
             time.sleep(5)
             
+            try:
+                reload_response = reload_future.result()
+                reload_response.close()
+                logger.info(f"Forced reload of group page response: {reload_response.status_code}")
+            except Exception as e:
+                logger.warning(f"Error forcing reload of group page: {str(e)}")
+            
             # Now specifically request the contacts listing API endpoint to trigger a UI refresh
             # Try multiple formats based on the screenshot URL pattern
             contact_list_urls = [
                 f"{self.base_url}/api/contact-groups/{group_id}/contacts?refresh=true&t={timestamp}",
                 f"{self.base_url}/api/contacts/contact-groups/{group_id}/list?refresh=true&t={timestamp}",
                 f"{self.base_url}/api/contacts/groups/{group_id}/contacts?refresh=true&t={timestamp}",
-                f"{self.base_url}/api/contacts?groupId={group_id}&page=1&pageSize=100&t={timestamp}"
+                self._contact_list_url_tmpl.format(gid=group_id, ts=timestamp)
             ]
             
             # If it's a dropdown ID, try without the C prefix
@@ -2804,118 +2968,50 @@ class PropStreamHTMLScraper:
                 numeric_id = group_id[1:]
                 contact_list_urls.append(f"{self.base_url}/api/contact-groups/{numeric_id}/contacts?refresh=true&t={timestamp}")
                 contact_list_urls.append(f"{self.base_url}/api/contacts/groups/{numeric_id}/contacts?refresh=true&t={timestamp}")
-                contact_list_urls.append(f"{self.base_url}/api/contacts?groupId={numeric_id}&page=1&pageSize=100&t={timestamp}")
+                contact_list_urls.append(self._contact_list_url_tmpl.format(gid=numeric_id, ts=timestamp))
             
             # Try each URL format multiple times with delays between attempts
-            max_attempts = 3
-            contact_count = 0
-            contacts_found = False
+            contact_count = self._poll_contact_count(contact_list_urls, file_id)
             
-            for attempt in range(max_attempts):
-                logger.info(f"Contact list retrieval attempt {attempt+1}/{max_attempts}")
+            # Only spend the final count, UI refresh and settle wait if the import is not confirmed yet
+            if contact_count <= 1:
+                logger.info("Making final direct attempt to count contacts...")
                 
-                for url in contact_list_urls:
-                    list_response = self.session.get(url)
-                    logger.info(f"Contact list API response ({url}): {list_response.status_code}")
-                    
-                    # If successful, save the response for debugging and extract count
-                    if list_response.status_code == 200:
-                        with open(f"contact_list_api_attempt{attempt+1}.json", "w", encoding="utf-8") as f:
-                            f.write(list_response.text)
-                        
-                        # Try to extract the contact count from the response
-                        try:
-                            contact_data = list_response.json()
-                            
-                            # Save full response for debugging
-                            with open(f"contact_data_raw_attempt{attempt+1}.json", "w", encoding="utf-8") as f:
-                                f.write(json.dumps(contact_data, indent=2))
-                            
-                            # Try different response formats
-                            if isinstance(contact_data, list):
-                                contact_count = len(contact_data)
-                                # Save the actual contacts for inspection
-                                with open(f"contact_items_attempt{attempt+1}.json", "w", encoding="utf-8") as f:
-                                    f.write(json.dumps(contact_data, indent=2))
-                            elif 'items' in contact_data:
-                                contact_count = len(contact_data['items'])
-                                # Save the actual contacts for inspection
-                                with open(f"contact_items_attempt{attempt+1}.json", "w", encoding="utf-8") as f:
-                                    f.write(json.dumps(contact_data['items'], indent=2))
-                            elif 'contacts' in contact_data:
-                                contact_count = len(contact_data['contacts'])
-                                # Save the actual contacts for inspection
-                                with open(f"contact_items_attempt{attempt+1}.json", "w", encoding="utf-8") as f:
-                                    f.write(json.dumps(contact_data['contacts'], indent=2))
-                            elif 'count' in contact_data:
-                                contact_count = contact_data['count']
-                            
-                            if contact_count > 0:
-                                contacts_found = True
-                                
-                                if file_id:
-                                    logger.info(f"IMPORTED CONTACTS COUNT: {contact_count} contacts were found in group (attempt {attempt+1})")
-                                    logger.info(f"IMPORT SOURCE: File ID: {file_id}")
-                                    
-                                    # Check if contact count is only 1 when we expect more
-                                    if contact_count == 1 and attempt < max_attempts - 1:
-                                        logger.warning("Only 1 contact found but more were expected. Will try again after delay...")
-                                        time.sleep(5)  # Wait before next attempt
-                                        continue
-                                else:
-                                    logger.info(f"CONTACTS COUNT: {contact_count} contacts found in group (attempt {attempt+1})")
-                                
-                                # If we found more than 1 contact, we can stop trying
-                                if contact_count > 1:
-                                    break
-                        except Exception as e:
-                            logger.warning(f"Error extracting contact count: {str(e)}")
+                # The final direct count and the UI refresh are independent, so issue them together
+                direct_contact_url = self._contact_list_url_tmpl.format(gid=group_id, ts=int(time.time()))
+                direct_future = self._io_pool.submit(self._pooled_get, direct_contact_url)
                 
-                # If we found satisfactory results, no need for more attempts
-                if contacts_found and contact_count > 1:
-                    break
-                    
-                # Add delay between attempts
-                if attempt < max_attempts - 1:
-                    logger.info(f"Waiting 10 seconds before next contact count attempt...")
-                    time.sleep(10)
-            
-            # If we still didn't find multiple contacts, try one last direct approach
-            if not contacts_found or contact_count <= 1:
-                logger.info("Making final direct attempt to count contacts...")
+                # Force a final UI refresh by visiting the exact URL in the screenshot,
+                # streaming so the page body is never downloaded
+                screenshot_url = f"{self.base_url}/contact/{group_id}"
+                screenshot_future = self._io_pool.submit(self._pooled_get, screenshot_url, stream=True)
                 
-                # Try to get the exact direct URL from the screenshot 
-                direct_contact_url = f"{self.base_url}/api/contacts?groupId={group_id}&page=1&pageSize=100&t={int(time.time())}"
-                direct_response = self.session.get(direct_contact_url)
-                logger.info(f"Final direct contact list API response: {direct_response.status_code}")
+                # Allow the UI up to 5 seconds to update, but stop waiting as soon as
+                # the final direct count confirms the import
+                settle_deadline = time.monotonic() + 5.0
+                
+                direct_response = direct_future.result()
+                logger.info("Final direct contact list API response: %s", direct_response.status_code)
                 
                 if direct_response.status_code == 200:
-                    with open("final_contact_list.json", "w", encoding="utf-8") as f:
-                        f.write(direct_response.text)
+                    _dump("final_contact_list.json", direct_response.content)
                     
                     try:
-                        final_data = direct_response.json()
-                        if isinstance(final_data, list):
-                            contact_count = len(final_data)
-                        elif 'items' in final_data:
-                            contact_count = len(final_data['items'])
-                        elif 'contacts' in final_data:
-                            contact_count = len(final_data['contacts'])
-                        elif 'count' in final_data:
-                            contact_count = final_data['count']
+                        final_data = orjson.loads(direct_response.content)
+                        contact_count, _ = self._extract_count_and_items(final_data)
                         
-                        logger.info(f"FINAL CONTACTS COUNT: {contact_count} contacts in group")
+                        logger.info("FINAL CONTACTS COUNT: %s contacts in group", contact_count)
                     except Exception as e:
-                        logger.warning(f"Error extracting final contact count: {str(e)}")
-            
-            # Force a final UI refresh by visiting the exact URL in the screenshot
-            screenshot_url = f"{self.base_url}/contact/{group_id}"
-            screenshot_response = self.session.get(screenshot_url)
-            logger.info(f"Final screenshot URL navigation response: {screenshot_response.status_code}")
-            
-            # Add some delay to allow the UI to update
-            logger.info("Waiting for UI to refresh with updated contacts...")
-            time.sleep(5)
+                        logger.warning("Error extracting final contact count: %s", e)
+                
+                remaining = settle_deadline - time.monotonic()
+                if contact_count <= 1 and remaining > 0:
+                    logger.info("Waiting for UI to refresh with updated contacts...")
+                    time.sleep(remaining)
+                
+                screenshot_response = screenshot_future.result()
+                screenshot_response.close()
+                logger.info("Final screenshot URL navigation response: %s", screenshot_response.status_code)
             
             # Final instructions for the user
             logger.info("=" * 80)
@@ -2,11 +2,16 @@ import os
 import re
 import time
 import csv
+import io
 import base64
+import shutil
+import hashlib
 import logging
 import asyncio
+import orjson
 from datetime import datetime
-from playwright.async_api import async_playwright, TimeoutError, Error
+from collections import namedtuple
+from playwright.async_api import async_playwright, expect, TimeoutError, Error
 import argparse
 
 # Set up logging
@@ -20,6 +25,269 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# The Playwright release the stack capture patch below was written against (pinned in requirements.txt)
+PLAYWRIGHT_STACK_PATCH_VERSION = "1.40."
+
+def _disable_playwright_stack_capture():
+    """Stop Playwright from walking the Python stack on every API call, when PROPSTREAM_PW_NO_STACKS=1
+    
+    The client calls inspect.stack() for each awaited call to label it in traces and error
+    messages, which is a large share of the CPU spent on fine-grained element calls. Without it,
+    errors no longer name the API call that failed, so this is opt-in. Only the client's own
+    reference is replaced, and only on the Playwright release it was written against.
+    """
+    if os.environ.get("PROPSTREAM_PW_NO_STACKS") != "1":
+        return
+    try:
+        import inspect
+        import types
+        from importlib.metadata import version, PackageNotFoundError
+        from playwright._impl import _connection
+    except ImportError:
+        return
+    try:
+        if not version("playwright").startswith(PLAYWRIGHT_STACK_PATCH_VERSION):
+            logger.warning(f"PROPSTREAM_PW_NO_STACKS ignored, written for Playwright {PLAYWRIGHT_STACK_PATCH_VERSION}x")
+            return
+    except PackageNotFoundError:
+        return
+    if getattr(_connection, "inspect", None) is not inspect:
+        # Newer or older client layouts are left alone rather than patched blindly
+        return
+    shim = types.ModuleType("inspect")
+    shim.__dict__.update(inspect.__dict__)
+    shim.stack = lambda *args, **kwargs: []
+    _connection.inspect = shim
+
+_disable_playwright_stack_capture()
+
+# Either of these showing up means the contacts page has rendered (or we were sent back to login)
+CONTACTS_READY_SELECTOR = 'button:has-text("Import"), [data-testid*="import"], input[name="username"]'
+
+# The app's sidebar (its Skip Tracing link) has rendered, or we were sent back to login
+APP_READY_SELECTOR = 'a:has(svg.icon-iconContactAppends), input[name="username"]'
+
+def _visible_union(selectors):
+    """Join selectors into a single selector list that only matches visible elements"""
+    return ", ".join(f"{selector}:visible" for selector in selectors)
+
+# Modals and overlays that are dismissed by clicking outside of them
+MODAL_ELEMENTS_VISIBLE = _visible_union(['.modal', '.dialog', '.overlay', '[role="dialog"]'])
+
+# Dialog containers whose text and buttons _wait_for_dom matches against
+DIALOG_CONTAINER_CSS = '.modal, .dialog, [role="dialog"], [aria-modal="true"]'
+
+# Buttons that decline browser permission prompts such as location access
+PERMISSION_BUTTON_SELECTORS = [
+    'button:has-text("Block")',
+    'button:has-text("Don\'t Allow")',
+    'button:has-text("No")',
+    'button:has-text("Reject")',
+    'button:has-text("Cancel")',
+    'button:has-text("Later")',
+    '[aria-label="Deny"]',
+    '[aria-label="Block"]',
+    'button[id*="deny"]',
+    'button[id*="block"]',
+    '.deny-button',
+    '.block-button'
+]
+
+# Close, dismiss and decline buttons found on PropStream popups
+POPUP_BUTTON_SELECTORS = [
+    # Close buttons
+    'button:has-text("Close")',
+    '.close-button',
+    '.modal-close',
+    '.popup-close',
+    'span.close',
+    'button.btn-close',
+    'button:has-text("×")',
+    'button:below(div:has-text("PROPSTREAM Updates"))',
+
+    # Block/cancel location buttons
+    'button:has-text("Block")',
+    'button:has-text("Don\'t Allow")',
+    'button:has-text("No")',
+    'button:has-text("Reject")',
+    'button:has-text("Cancel")',
+    'button:has-text("Later")',
+
+    # Additional selectors
+    '[aria-label="Close"]',
+    '[aria-label="Dismiss"]',
+    '[aria-label="Cancel"]',
+    '[aria-label="Block"]',
+    '[aria-label="Deny"]'
+]
+
+# Elements that indicate a file upload dialog is open
+UPLOAD_SELECTORS = [
+    'input[type="file"]',
+    '.file-upload',
+    '.upload-area',
+    '[data-testid="file-upload"]',
+    'div:has-text("Upload File")',
+    'div:has-text("Choose File")',
+    'div:has-text("Select File")',
+    'div:has-text("Drag and drop")',
+    'div[role="dialog"]', # General dialog check
+    'div.modal',          # Modal check
+    'div.file-input',
+    'input[accept=".csv"]'
+]
+
+# Button text that declines a location prompt
+DENY_BUTTON_TEXT = re.compile(r"block|deny|don'?t allow|\bno\b|cancel|reject|later", re.I)
+
+# Union selectors are built once so each handler needs a single query per pass
+PERMISSION_BUTTONS_VISIBLE = _visible_union(PERMISSION_BUTTON_SELECTORS)
+POPUP_BUTTONS_VISIBLE = _visible_union(POPUP_BUTTON_SELECTORS)
+UPLOAD_ELEMENTS_VISIBLE = _visible_union(UPLOAD_SELECTORS)
+UPLOAD_ELEMENTS = ", ".join(UPLOAD_SELECTORS)
+
+# Shown once an uploaded file has been read and the import can move on
+UPLOAD_PROCESSED_TEXT = "processed|uploaded"
+UPLOAD_PROCESSED_BUTTON_TEXT = "continue|next"
+
+# Where the import dialog's upload request is recorded so later runs can post files directly
+UPLOAD_ENDPOINT_PATH = "propstream_upload_endpoint.json"
+UPLOAD_FIELD_PATTERN = re.compile(rb'name="([^"]+)"; filename=')
+# Request headers never written to the upload endpoint file: per-request ones and anything carrying credentials
+UPLOAD_SKIPPED_HEADERS = ("content-type", "content-length", "cookie", "authorization", "proxy-authorization")
+UPLOAD_CREDENTIAL_HEADER = re.compile(r'auth|token|csrf|xsrf|session', re.IGNORECASE)
+# Keys an upload response may use for the name of the group it created
+UPLOAD_GROUP_NAME_KEYS = ("groupName", "group_name", "name")
+
+# Buffer size for CSV output so rows are flushed to disk in large blocks
+CSV_WRITE_BUFFER = 64 * 1024
+
+# Button text that confirms the group dialog, and text that rules a button out
+SAVE_BUTTON_TEXT = re.compile(r"save|done|submit|import|ok|continue|next|create", re.I)
+NOT_SAVE_BUTTON_TEXT = re.compile(r"cancel|back|close", re.I)
+
+# Input attributes that show a text field is not the group name input
+NOT_GROUP_NAME_FIELD = re.compile(r"search|filter|email|password|phone|address", re.I)
+
+# Elements and page text that indicate the group creation dialog is open
+GROUP_DIALOG_SELECTORS = [
+    'div:has-text("Create New Group")',
+    'div:has-text("Add to Group")',
+    'div:has-text("Select Group")',
+    'div:has-text("Group Name")',
+    'input[placeholder*="group" i]',
+    'input[placeholder*="name" i]',
+    'input.new-group-input',
+    'input[name="groupName"]',
+    'div.group-selection',
+    'div.group-creation',
+    'div[role="dialog"]',
+    'div.modal',
+    # :has-text is case-insensitive, so these match the page text the same way a lowercased innerText search would
+    'body:has-text("Create New Group")',
+    'body:has-text("Add to Group")',
+    'body:has-text("Select Group")',
+    'body:has-text("Group Name")'
+]
+GROUP_DIALOG_ELEMENTS_VISIBLE = _visible_union(GROUP_DIALOG_SELECTORS)
+
+# The same indicators as plain CSS and text, for the MutationObserver wait
+GROUP_DIALOG_CSS = [selector for selector in GROUP_DIALOG_SELECTORS if ':has-text' not in selector]
+GROUP_DIALOG_TEXT = "create new group|add to group|select group|group name"
+
+# Inputs that take the name of the group being created
+GROUP_NAME_INPUT_SELECTORS = [
+    'input[placeholder="New Group"]',
+    'input[placeholder*="group" i]',
+    'input[placeholder*="name" i]',
+    'input.new-group-input',
+    'input[name="groupName"]',
+    'input[id*="group" i][type="text"]',
+    'input[id*="name" i][type="text"]',
+    'input[type="text"]:near(:text("Group"))',
+    'input[type="text"]:near(:text("Name"))'
+]
+GROUP_NAME_INPUTS = ", ".join(GROUP_NAME_INPUT_SELECTORS)
+
+# The "Create New" group option in the group dialog
+CREATE_NEW_SELECTORS = [
+    'input[value="new"]',
+    'label:has-text("Create New")',
+    'div:has-text("Create New") input',
+    'input#create-new',
+    'input[name="groupRadio"][value="new"]',
+    'input[type="radio"]:below(label:has-text("Create New"))',
+    'input[type="radio"]:near(:text("Create New"))',
+    'label:has-text("Create New") input'
+]
+
+# Buttons that confirm the group dialog, in priority order
+SAVE_BUTTON_SELECTORS = [
+    'button[type="submit"]',
+    'button:has-text("Save")',
+    'button:has-text("Submit")',
+    'button:has-text("Import")',
+    'button:has-text("Continue")',
+    'button:has-text("Next")',
+    'button:has-text("Done")',
+    '.save-button',
+    '[data-testid="save-button"]',
+    '[data-testid="submit-button"]',
+    '[data-testid="continue-button"]',
+    'div[role="button"]:has-text("Save")',
+    'div[role="button"]:has-text("Submit")',
+    'div[role="button"]:has-text("Import")',
+    'div[role="button"]:has-text("Continue")',
+    'div[role="button"]:has-text("Next")'
+]
+SAVE_BUTTONS_VISIBLE = _visible_union(SAVE_BUTTON_SELECTORS)
+
+# Elements and messages shown once an import has finished, checked in-page so they are plain CSS and a text pattern
+IMPORT_COMPLETION_CSS = ['.success-message', '[data-testid="import-success"]']
+IMPORT_COMPLETION_TEXT = "import completed|import successful|group created"
+
+# Job names in the contacts page sidebar, and the contact count shown next to each
+SIDEBAR_JOB_NAME_SELECTOR = 'div.src-app-components-ToggleList-style__tt0fX__labelName'
+SIDEBAR_JOB_QUANTITY_SELECTOR = 'div.src-app-components-ToggleList-style__orTGe__labelQuantity'
+JOB_COUNT_PATTERN = re.compile(r'\(0*[1-9][\d,]*\)')  # A non-zero contact count in parentheses
+
+# One skip traced contact, with fields in the CSV's column order
+Contact = namedtuple('Contact', ['name', 'mobile_phone', 'landline', 'phone', 'email'])
+CSV_FIELDNAMES = ['Name', 'Mobile Phone', 'Landline', 'Phone', 'Email']
+
+# Rows of the skip traced contacts grid, and the cell in each row that holds every CSV field. Cells are
+# found by their col-id where possible; the positional selectors only apply if no col-id matches
+GRID_ROW_SELECTOR = 'div.ag-row'
+GRID_CELL_SELECTORS = [
+    ('Name', ['[col-id="name"]']),
+    ('Mobile Phone', ['[id^="cell-mobilePhone-"]']),
+    ('Landline', ['[id^="cell-landlinePhone-"]']),
+    ('Phone', ['[col-id="otherPhone"]', '[col-id="phone"]', ':nth-child(4)']),
+    ('Email', ['[col-id="email"]', ':nth-child(5)'])
+]
+
+# Row model keys for each CSV field when the grid's data is read through its API, named after the cells'
+# col-ids and ids in GRID_CELL_SELECTORS. The row model is only used if every field has one of its keys
+GRID_MODEL_FIELDS = [
+    ('Name', ['name']),
+    ('Mobile Phone', ['mobilePhone']),
+    ('Landline', ['landlinePhone']),
+    ('Phone', ['otherPhone', 'phone']),
+    ('Email', ['email'])
+]
+
+# Bot checks that need a person at a visible browser window
+CAPTCHA_SELECTOR = 'iframe[src*="recaptcha"], iframe[src*="hcaptcha"], iframe[title*="hcaptcha"]'
+
+# Requests the scraper never needs; stylesheets are kept since visibility checks depend on them
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+BLOCKED_HOSTS = ("google-analytics", "googletagmanager", "doubleclick", "segment.io", "hotjar", "intercom")
+
+# Content-hashed script and stylesheet bundles never change, so they are kept on disk between runs
+ASSET_CACHE_DIR = ".pw_cache"
+CACHED_RESOURCE_TYPES = {"script", "stylesheet"}
+HASHED_ASSET_PATTERN = re.compile(r'[.-][0-9a-f]{8,}(\.chunk)?\.(js|css)(\?|$)')
+
 class PropStreamPlaywrightScraper:
     def __init__(self, username, password):
         self.username = username
@@ -31,55 +299,85 @@ class PropStreamPlaywrightScraper:
             
         self.base_url = "https://app.propstream.com"
         self.login_url = "https://login.propstream.com/"
+        self.playwright = None
+        self.headless = True
+        self.cdp_endpoint = None
+        self._owns_playwright = False  # Only stop the Playwright driver if this scraper started it
         self.browser = None
         self.page = None
         self.extracted_data = []
         self.skip_trace_list_name = None
+        self.debug_screens = os.environ.get("PROPSTREAM_DEBUG_SCREENS") == "1"  # Save step-by-step screenshots
+        self.storage_state_path = "propstream_state.json"  # Cookies and local storage saved after login
+        self._selector_hit_cache = {}  # Last selector that matched for each probe, tried first next time
+        self._job_selected = False  # Set once wait_for_order_completion has opened the job's contacts in the grid
     
-    async def setup_browser(self, headless=False, use_mock=False):
-        """Initialize browser session"""
+    async def setup_browser(self, headless=True, use_mock=False, cdp_endpoint=None, playwright=None, debug=False):
+        """Initialize browser session, attaching to an already running Chromium when cdp_endpoint is given
+        
+        Pass a started Playwright instance to share one driver between several scrapers.
+        debug=True slows down a headed browser and relaxes its same-origin checks for troubleshooting.
+        """
         logger.info("Setting up browser")
         
-        # Check if the file exists
+        # Check if the file exists (one stat gives both existence and size)
         file_path = "foreclosures_processed.csv"
-        if not os.path.exists(file_path):
+        try:
+            file_stat = os.stat(file_path)
+        except FileNotFoundError:
+            file_stat = None
+        
+        if file_stat is None:
             logger.error(f"File not found: {file_path}")
             logger.info("Creating a sample CSV file for testing")
             # Create a sample file
-            with open(file_path, 'w', newline='') as f:
+            with open(file_path, 'w', newline='', encoding='utf-8', buffering=CSV_WRITE_BUFFER) as f:
                 writer = csv.writer(f)
-                writer.writerow(['Name', 'Address', 'City', 'State', 'Zip', 'Email'])
-                writer.writerow(['John Doe', '123 Main St', 'Anytown', 'MI', '49503', 'john@example.com'])
-                writer.writerow(['Jane Smith', '456 Oak Ave', 'Somewhere', 'MI', '49504', 'jane@example.com'])
+                writer.writerows([
+                    ['Name', 'Address', 'City', 'State', 'Zip', 'Email'],
+                    ['John Doe', '123 Main St', 'Anytown', 'MI', '49503', 'john@example.com'],
+                    ['Jane Smith', '456 Oak Ave', 'Somewhere', 'MI', '49504', 'jane@example.com']
+                ])
             logger.info(f"Created sample file: {file_path}")
         else:
-            logger.info(f"Found file: {file_path}")
-            # Check file size and content
-            file_size = os.path.getsize(file_path)
-            logger.info(f"File size: {file_size} bytes")
-            
-            if file_size > 0:
-                with open(file_path, 'r', newline='', encoding='utf-8', errors='ignore') as f:
-                    sample = f.read(1000)
-                    logger.info(f"File sample: {sample[:100]}...")
+            logger.info(f"Found file: {file_path} ({file_stat.st_size} bytes)")
+            
+            # Only read as much as gets logged
+            if file_stat.st_size > 0:
+                with open(file_path, 'rb') as f:
+                    sample = f.read(100).decode('utf-8', errors='ignore')
+                logger.info(f"File sample: {sample}...")
         
         if use_mock:
             logger.info("Mock mode enabled, skipping browser setup")
             return None
             
-        playwright = await async_playwright().start()
+        if playwright is None:
+            playwright = await async_playwright().start()
+            self._owns_playwright = True
+        self.playwright = playwright
+        self.headless = headless
+        self.cdp_endpoint = cdp_endpoint
+        self.debug = debug
         
-        # Set slower navigation options
-        slow_mo = 100  # Slow down by 100ms
-        self.browser = await playwright.chromium.launch(
-            headless=headless, 
-            slow_mo=slow_mo,
-            args=[
-                "--disable-web-security", 
-                "--disable-features=IsolateOrigins,site-per-process",
-                "--disable-notifications"
-            ]
-        )
+        if cdp_endpoint:
+            # Share one Chromium process between scrapers; each still gets its own isolated context below
+            logger.info(f"Connecting to existing browser at {cdp_endpoint}")
+            self.browser = await playwright.chromium.connect_over_cdp(cdp_endpoint)
+        else:
+            args = ["--disable-notifications"]
+            slow_mo = 0
+            if debug:
+                # Keep site isolation and same-origin checks on in production; they are only relaxed for debugging
+                args += ["--disable-web-security", "--disable-features=IsolateOrigins,site-per-process"]
+                if not headless:
+                    # Slow down every action so a headed run can be followed by eye (PROPSTREAM_SLOW_MO overrides the delay)
+                    slow_mo = int(os.environ.get("PROPSTREAM_SLOW_MO", "100"))
+            self.browser = await playwright.chromium.launch(
+                headless=headless, 
+                slow_mo=slow_mo,
+                args=args
+            )
         
         # Configure browser context with permissions already blocked
         self.context = await self.browser.new_context(
@@ -87,7 +385,9 @@ class PropStreamPlaywrightScraper:
             user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
             ignore_https_errors=True,
             # Set geolocation to a fixed position (optional)
-            geolocation={"latitude": 37.7749, "longitude": -122.4194}
+            geolocation={"latitude": 37.7749, "longitude": -122.4194},
+            # Restore the session from a previous run if one was saved
+            storage_state=self.storage_state_path if os.path.exists(self.storage_state_path) else None
         )
         
         # Grant or deny permissions explicitly - this is the correct way to block geolocation
@@ -95,17 +395,23 @@ class PropStreamPlaywrightScraper:
         # Using the permissions API correctly - we don't grant geolocation permission
         await self.context.grant_permissions([], origin=self.base_url)
         
-        # Set longer timeouts
-        self.context.set_default_timeout(120000)  # 2 minutes timeout
+        # Keep selector probes short but give page navigations plenty of time
+        self.context.set_default_timeout(20000)  # 20 seconds for actions and selectors
+        self.context.set_default_navigation_timeout(120000)  # 2 minutes for navigations
         
         self.page = await self.context.new_page()
         
+        # Skip downloading images, fonts, media and analytics scripts
+        await self.page.route("**/*", self._route_request)
+        
         # Set up JavaScript dialog handler
         self.page.on("dialog", lambda dialog: asyncio.create_task(self.handle_dialog(dialog)))
         
-        # Enable request/response logging
-        self.page.on("request", lambda request: logger.debug(f">> Request: {request.method} {request.url}"))
-        self.page.on("response", lambda response: logger.debug(f"<< Response: {response.status} {response.url}"))
+        # Enable request/response and console logging, only when DEBUG logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            self.page.on("request", lambda request: logger.debug(">> Request: %s %s", request.method, request.url))
+            self.page.on("response", lambda response: logger.debug("<< Response: %s %s", response.status, response.url))
+            self.page.on("console", lambda msg: logger.debug("CONSOLE: %s", msg.text))
         
         # Add custom headers that mimic browser behavior
         await self.page.set_extra_http_headers({
@@ -114,13 +420,9 @@ class PropStreamPlaywrightScraper:
             "Accept-Encoding": "gzip, deflate, br",
             "Connection": "keep-alive",
             "Upgrade-Insecure-Requests": "1",
-            "Cache-Control": "max-age=0",
-            "X-Requested-With": "XMLHttpRequest"
+            "Cache-Control": "max-age=0"
         })
         
-        # Enable JavaScript console logging
-        self.page.on("console", lambda msg: logger.debug(f"CONSOLE: {msg.text}"))
-        
         # Override geolocation using Context API instead of page
         try:
             # Modern Playwright versions use context.set_geolocation
@@ -153,6 +455,47 @@ class PropStreamPlaywrightScraper:
         
         return self.page
     
+    async def _route_request(self, route):
+        """Abort requests for assets and trackers that the scraper does not need"""
+        request = route.request
+        if request.resource_type in BLOCKED_RESOURCE_TYPES or any(host in request.url for host in BLOCKED_HOSTS):
+            await route.abort()
+        elif (request.method == "GET" and request.resource_type in CACHED_RESOURCE_TYPES
+                and HASHED_ASSET_PATTERN.search(request.url)):
+            await self._fulfill_from_asset_cache(route)
+        else:
+            await route.continue_()
+    
+    async def _fulfill_from_asset_cache(self, route):
+        """Serve a hashed JS/CSS bundle from the disk cache, downloading and storing it on a miss"""
+        key = hashlib.sha1(route.request.url.encode()).hexdigest()
+        body_path = os.path.join(ASSET_CACHE_DIR, key)
+        headers_path = body_path + ".hdr"
+        
+        if os.path.exists(body_path) and os.path.exists(headers_path):
+            with open(headers_path, 'rb') as f:
+                headers = orjson.loads(f.read())
+            with open(body_path, 'rb') as f:
+                body = f.read()
+            await route.fulfill(status=200, headers=headers, body=body)
+            return
+        
+        response = await route.fetch()
+        if response.ok:
+            try:
+                body = await response.body()
+                # The body is stored decoded, so the transfer headers no longer apply
+                headers = {name: value for name, value in response.headers.items()
+                           if name.lower() not in ("content-encoding", "content-length", "transfer-encoding")}
+                os.makedirs(ASSET_CACHE_DIR, exist_ok=True)
+                with open(body_path, 'wb') as f:
+                    f.write(body)
+                with open(headers_path, 'wb') as f:
+                    f.write(orjson.dumps(headers))
+            except Exception as e:
+                logger.debug(f"Could not cache asset {route.request.url}: {str(e)}")
+        await route.fulfill(response=response)
+    
     async def login(self, use_mock=False):
         """Login to PropStream"""
         if use_mock:
@@ -161,7 +504,15 @@ class PropStreamPlaywrightScraper:
             
         logger.info("Logging in to PropStream...")
         try:
-            await self.page.goto(self.login_url, wait_until="networkidle")
+            await self.page.goto(self.login_url, wait_until="domcontentloaded")
+            
+            # A CAPTCHA cannot be solved headless, so reopen the login page in a visible browser. Its iframe
+            # is injected by script after DOMContentLoaded, so give it a moment to appear before ruling it out
+            if self.headless and not self.cdp_endpoint and await self._captcha_shown(timeout=2000):
+                await self._relaunch_headed()
+                await self.page.goto(self.login_url, wait_until="domcontentloaded")
+            
+            await self.page.locator('input[name="username"]').wait_for(state="visible", timeout=15000)
             
             # Fill username
             await self.page.fill('input[name="username"]', self.username)
@@ -173,8 +524,15 @@ class PropStreamPlaywrightScraper:
             logger.info("Clicking login button and waiting for navigation")
             
             # Use promise_all to wait for multiple events
-            async with self.page.expect_navigation(wait_until="networkidle", timeout=30000):
-                await self.page.click('button[type="submit"]')
+            try:
+                async with self.page.expect_navigation(wait_until="domcontentloaded", timeout=30000):
+                    await self.page.click('button[type="submit"]')
+            except TimeoutError:
+                # A CAPTCHA that showed up after the first check can hold the submit, so log in again headed
+                if self.headless and not self.cdp_endpoint and await self._captcha_shown(timeout=0):
+                    await self._relaunch_headed()
+                    return await self.login()
+                raise
             
             logger.info("Login successful")
             
@@ -184,7 +542,7 @@ class PropStreamPlaywrightScraper:
             # After login, check for and handle the PropStream updates popup
             try:
                 # Take a screenshot to see what's on screen
-                await self.page.screenshot(path="after_login_before_popup.png")
+                await self._debug_screenshot("after_login_before_popup.png")
                 
                 # Wait for the PropStream updates popup to appear
                 logger.info("Checking for PropStream updates popup...")
@@ -195,69 +553,215 @@ class PropStreamPlaywrightScraper:
                 # Navigate to the main dashboard URL
                 dashboard_url = "https://app.propstream.com/"
                 logger.info(f"Navigating to main dashboard: {dashboard_url}")
-                await self.page.goto(dashboard_url, wait_until="networkidle")
+                await self.page.goto(dashboard_url, wait_until="domcontentloaded")
+                await self._wait_until_ready(APP_READY_SELECTOR, timeout=15000)
                 
                 # Check again for any popups after navigating to dashboard
                 await self.handle_permission_prompts()
                 
                 # Take a screenshot after handling the popup
-                await self.page.screenshot(path="after_popup_handling.png")
+                await self._debug_screenshot("after_popup_handling.png")
                 
             except Exception as e:
                 logger.warning(f"Error handling updates popup: {str(e)}")
                 # Even if we can't handle the popup, try to continue with the process
             
-            # Save cookies for potential future use
-            cookies = await self.context.cookies()
-            with open("propstream_cookies.json", "w") as f:
-                import json
-                json.dump(cookies, f)
-            logger.info("Saved cookies for future sessions")
+            # Save cookies and local storage so future runs can skip the login
+            await self.context.storage_state(path=self.storage_state_path)
+            logger.info("Saved session state for future runs")
             
             return True
                 
         except Exception as e:
             logger.error(f"Login failed: {str(e)}")
             # Take a screenshot of the failed login for debugging
-            await self.page.screenshot(path="login_error.png")
+            await self._error_screenshot("login_error.jpg")
+            return False
+    
+    async def _race_visible(self, families, timeout=3000):
+        """Wait on several named selector groups at once, returning the name of the first to show a visible element"""
+        tasks = {
+            asyncio.create_task(self.page.locator(", ".join(selectors)).first.wait_for(state="visible", timeout=timeout)): name
+            for name, selectors in families.items()
+        }
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return tasks[task]
+            return None
+        finally:
+            for task in pending:
+                task.cancel()
+            # Collect every outcome so the losing tasks' timeouts are not reported as never retrieved
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def _captcha_shown(self, timeout):
+        """Return True if a CAPTCHA iframe is on the page or is added within timeout milliseconds"""
+        try:
+            await self.page.locator(CAPTCHA_SELECTOR).first.wait_for(state="attached", timeout=timeout or 1)
+            return True
+        except (TimeoutError, Error):
             return False
     
+    async def _relaunch_headed(self):
+        """Replace the headless browser with a visible one, keeping the same Playwright driver"""
+        logger.warning("CAPTCHA detected, relaunching the browser in headed mode")
+        await self.browser.close()
+        await self.setup_browser(headless=False, playwright=self.playwright, debug=self.debug)
+    
+    async def is_logged_in(self):
+        """Check whether the current browser session is still authenticated"""
+        try:
+            await self.page.goto(f"{self.base_url}/contact", wait_until="domcontentloaded")
+            # The app only redirects an expired session to login after it hydrates, so decide from
+            # whether the app's content or the username field renders rather than from the URL
+            if not await self._wait_until_ready(f"{CONTACTS_READY_SELECTOR}, {APP_READY_SELECTOR}"):
+                return False
+            return not await self.page.locator('input[name="username"]').is_visible() and "login.propstream.com" not in self.page.url
+        except Exception as e:
+            logger.warning(f"Error checking login state: {str(e)}")
+            return False
+    
+    async def _wait_until_ready(self, selector, timeout=10000):
+        """Wait for an element that shows the page is usable, returning False if it never appears"""
+        try:
+            await self.page.locator(selector).first.wait_for(state="visible", timeout=timeout)
+            return True
+        except TimeoutError:
+            logger.debug(f"Page not ready after {timeout}ms, no visible match for: {selector}")
+            return False
+    
+    async def _wait_hidden(self, element, timeout=3000):
+        """Wait for a clicked popup element to close, giving up quietly after the timeout"""
+        try:
+            await element.wait_for_element_state("hidden", timeout=timeout)
+        except (TimeoutError, Error):
+            logger.debug(f"Element still visible after {timeout}ms")
+    
+    async def _wait_for_dom(self, css_selectors=(), text_pattern=None, button_pattern=None, timeout=2000):
+        """Wait for plain CSS selectors or dialog text to become visible using an in-page MutationObserver
+        
+        Resolves as soon as nodes are added that match instead of on the next polling tick. Text and
+        button patterns are only matched inside visible dialog containers, and a button's whole label
+        must match. Returns False on timeout. Playwright-only selectors (such as :has-text) cannot be used here.
+        """
+        try:
+            return await self.page.evaluate('''([sels, containerSel, textSource, buttonSource, timeout]) => new Promise(resolve => {
+                const text = textSource && new RegExp(textSource, 'i');
+                const buttonText = buttonSource && new RegExp('^(?:' + buttonSource + ')$', 'i');
+                const visible = el => el.getClientRects().length > 0 && getComputedStyle(el).visibility !== 'hidden';
+                const found = () => {
+                    if (sels.some(s => [...document.querySelectorAll(s)].some(visible))) {
+                        return true;
+                    }
+                    if (!text && !buttonText) {
+                        return false;
+                    }
+                    return [...document.querySelectorAll(containerSel)].filter(visible).some(container =>
+                        (text && text.test(container.innerText)) ||
+                        (buttonText && [...container.querySelectorAll('button')].some(b => visible(b) && buttonText.test(b.innerText.trim()))));
+                };
+                if (found()) {
+                    return resolve(true);
+                }
+                const observer = new MutationObserver(() => {
+                    if (found()) {
+                        observer.disconnect();
+                        clearTimeout(timer);
+                        resolve(true);
+                    }
+                });
+                const timer = setTimeout(() => {
+                    observer.disconnect();
+                    resolve(false);
+                }, timeout);
+                observer.observe(document.documentElement, {subtree: true, childList: true});
+            })''', [list(css_selectors), DIALOG_CONTAINER_CSS, text_pattern, button_pattern, timeout])
+        except Error as e:
+            logger.debug(f"Error waiting for DOM change: {str(e)}")
+            return False
+    
+    async def _wait_for_value(self, element, timeout=1000):
+        """Wait until a filled input reports a non-empty value"""
+        try:
+            await self.page.wait_for_function("el => el.value.length > 0", arg=element, timeout=timeout)
+        except (TimeoutError, Error):
+            logger.debug(f"Input still empty after {timeout}ms")
+    
+    async def _debug_screenshot(self, path):
+        """Save a diagnostic screenshot, only when PROPSTREAM_DEBUG_SCREENS=1"""
+        if self.debug_screens:
+            await self.page.screenshot(path=path)
+    
+    async def _error_screenshot(self, path):
+        """Save a screenshot of a failure without letting a broken page mask the original error
+        
+        Saved as a viewport-only JPEG, which encodes much faster and is far smaller than a PNG.
+        """
+        try:
+            await self.page.screenshot(path=path, type="jpeg", quality=60, timeout=5000)
+        except Error as e:
+            logger.debug(f"Could not save {path}: {str(e)}")
+    
+    async def _visible_matches(self, union_selector):
+        """Return every visible element matching a union selector built by _visible_union, in a single query"""
+        return await self.page.query_selector_all(union_selector)
+    
+    def _cached_first(self, cache_key, selectors):
+        """Return selectors with the last one that matched for cache_key moved to the front"""
+        cached = self._selector_hit_cache.get(cache_key)
+        if cached in selectors:
+            return [cached] + [selector for selector in selectors if selector != cached]
+        return list(selectors)
+    
+    async def _first_visible(self, selectors, cache_key=None):
+        """Return (selector, element) for the first selector in priority order with a visible match
+        
+        With a cache_key, the selector that matched last time is tried first and the winner is remembered.
+        """
+        if cache_key:
+            cached = self._selector_hit_cache.get(cache_key)
+            if cached in selectors:
+                element = await self.page.query_selector(f"{cached}:visible")
+                if element:
+                    return cached, element
+        # One batched query settles the common case where nothing is visible at all
+        if not await self._visible_matches(_visible_union(selectors)):
+            return None, None
+        # Otherwise probe every selector concurrently and take the first match in priority order
+        elements = await asyncio.gather(*(self.page.query_selector(f"{selector}:visible") for selector in selectors))
+        for selector, element in zip(selectors, elements):
+            if element:
+                if cache_key:
+                    self._selector_hit_cache[cache_key] = selector
+                return selector, element
+        return None, None
+    
     async def handle_permission_prompts(self):
         """Handle browser permission prompts like location access"""
         logger.info("Checking for permission prompts...")
         
         # Take a screenshot to see what's on the page
-        await self.page.screenshot(path="before_permission_handling.png")
+        await self._debug_screenshot("before_permission_handling.png")
         
         try:
-            # Look for location permission dialogs
-            permission_buttons = [
-                'button:has-text("Block")',
-                'button:has-text("Don\'t Allow")',
-                'button:has-text("No")',
-                'button:has-text("Reject")',
-                'button:has-text("Cancel")',
-                'button:has-text("Later")',
-                '[aria-label="Deny"]',
-                '[aria-label="Block"]',
-                'button[id*="deny"]',
-                'button[id*="block"]',
-                '.deny-button',
-                '.block-button'
-            ]
-            
-            for selector in permission_buttons:
+            # Look for location permission dialogs, finding every visible button in one query
+            for button in await self._visible_matches(PERMISSION_BUTTONS_VISIBLE):
                 try:
-                    # Check if element exists and is visible
-                    button = await self.page.query_selector(selector)
-                    if button and await button.is_visible():
-                        logger.info(f"Found permission button with selector: {selector}")
-                        await button.click()
-                        logger.info(f"Clicked permission button: {selector}")
-                        await asyncio.sleep(1)
-                        await self.page.screenshot(path="after_permission_button_click.png")
+                    # An earlier click may have closed the prompt this button belonged to
+                    if not await button.is_visible():
+                        continue
+                    button_text = (await button.inner_text()).strip()
+                    logger.info(f"Found permission button: '{button_text}'")
+                    await button.click(timeout=5000)
+                    logger.info(f"Clicked permission button: '{button_text}'")
+                    await self._wait_hidden(button)
+                    await self._debug_screenshot("after_permission_button_click.png")
                 except Exception as e:
-                    logger.debug(f"Error handling permission button {selector}: {str(e)}")
+                    logger.debug(f"Error handling permission button: {str(e)}")
             
             # Check for location prompts by looking for elements containing location-related text
             location_prompts = await self.page.query_selector_all('div:has-text("location"), div:has-text("Location"), div:has-text("Know your location")')
@@ -265,18 +769,18 @@ class PropStreamPlaywrightScraper:
                 if await prompt.is_visible():
                     logger.info("Found possible location prompt")
                     
-                    # Look for buttons within the prompt
-                    buttons = await prompt.query_selector_all('button')
-                    for button in buttons:
-                        button_text = await button.inner_text()
+                    # Read the text of every button within the prompt in one call
+                    button_texts = await prompt.eval_on_selector_all('button', 'buttons => buttons.map(b => b.innerText)')
+                    for i, button_text in enumerate(button_texts):
                         logger.info(f"Found button in location prompt: {button_text}")
                         
                         # Click on block/deny/cancel buttons
-                        if any(word in button_text.lower() for word in ["block", "deny", "don't allow", "no", "cancel", "reject"]):
+                        if DENY_BUTTON_TEXT.search(button_text):
                             logger.info(f"Clicking location prompt button: {button_text}")
-                            await button.click()
-                            await asyncio.sleep(1)
-                            await self.page.screenshot(path="after_location_prompt_button_click.png")
+                            buttons = await prompt.query_selector_all('button')
+                            await buttons[i].click()
+                            await self._wait_hidden(prompt)
+                            await self._debug_screenshot("after_location_prompt_button_click.png")
                             break
             
             # Try to handle permissions using JavaScript dialog handler
@@ -301,165 +805,100 @@ class PropStreamPlaywrightScraper:
         """Handle all types of popups including PropStream updates"""
         logger.info("Handling all possible popups...")
         
-        # Look for various close buttons in popups
-        popup_buttons = [
-            # Close buttons
-            'button:has-text("Close")',
-            '.close-button',
-            '.modal-close',
-            '.popup-close',
-            'span.close',
-            'button.btn-close',
-            'button:has-text("×")',
-            'button:below(div:has-text("PROPSTREAM Updates"))',
-            
-            # Block/cancel location buttons
-            'button:has-text("Block")',
-            'button:has-text("Don\'t Allow")',
-            'button:has-text("No")',
-            'button:has-text("Reject")',
-            'button:has-text("Cancel")',
-            'button:has-text("Later")',
-            
-            # Additional selectors
-            '[aria-label="Close"]',
-            '[aria-label="Dismiss"]',
-            '[aria-label="Cancel"]',
-            '[aria-label="Block"]',
-            '[aria-label="Deny"]'
-        ]
+        # Look for various close buttons in popups, finding every visible one in one query
+        try:
+            elements = await self._visible_matches(POPUP_BUTTONS_VISIBLE)
+        except Exception as e:
+            logger.debug(f"Error looking for popup buttons: {str(e)}")
+            elements = []
         
-        # Check each button type
-        for selector in popup_buttons:
+        for i, element in enumerate(elements):
             try:
-                # Find all matching elements
-                elements = await self.page.query_selector_all(selector)
-                for element in elements:
-                    if await element.is_visible():
-                        # Take a screenshot before clicking
-                        safe_selector = selector.replace(':', '_').replace('"', '')
-                        await self.page.screenshot(path=f"before_clicking_{safe_selector}.png")
-                        
-                        # Get button text if possible
-                        try:
-                            button_text = await element.inner_text()
-                            logger.info(f"Found popup button: '{button_text}' with selector: {selector}")
-                        except:
-                            logger.info(f"Found popup button with selector: {selector}")
-                        
-                        # Click the button
-                        await element.click()
-                        logger.info(f"Clicked popup button with selector: {selector}")
-                        
-                        # Wait a moment for the popup to close
-                        await asyncio.sleep(1)
-                        
-                        # Take another screenshot
-                        await self.page.screenshot(path=f"after_clicking_{safe_selector}.png")
+                # Skip buttons whose popup an earlier click already closed
+                if not await element.is_visible():
+                    logger.debug(f"Popup button {i} is no longer visible")
+                    continue
+                
+                # Take a screenshot before clicking
+                await self._debug_screenshot(f"before_clicking_popup_button_{i}.png")
+                
+                # Get button text if possible
+                try:
+                    button_text = await element.inner_text()
+                    logger.info(f"Found popup button: '{button_text}'")
+                except:
+                    logger.info("Found popup button")
+                
+                # Click the button
+                await element.click(timeout=5000)
+                logger.info(f"Clicked popup button {i}")
+                
+                # Wait for the popup to close
+                await self._wait_hidden(element)
+                
+                # Take another screenshot
+                await self._debug_screenshot(f"after_clicking_popup_button_{i}.png")
             except Exception as e:
-                logger.debug(f"Error handling popup with selector {selector}: {str(e)}")
+                logger.debug(f"Error handling popup button {i}: {str(e)}")
         
-        # Check for modals and overlays that might need to be clicked outside of
-        modal_selectors = ['.modal', '.dialog', '.overlay', '[role="dialog"]']
-        for selector in modal_selectors:
-            try:
-                modal = await self.page.query_selector(selector)
-                if modal and await modal.is_visible():
-                    logger.info(f"Found modal/overlay with selector: {selector}")
-                    # Try to click outside
-                    await self.page.mouse.click(10, 10)
-                    logger.info("Clicked outside modal to dismiss it")
-                    await asyncio.sleep(1)
-            except Exception as e:
-                logger.debug(f"Error handling modal with selector {selector}: {str(e)}")
+        # Check for modals and overlays that might need to be clicked outside of, all in one query
+        try:
+            modals = await self._visible_matches(MODAL_ELEMENTS_VISIBLE)
+            if modals:
+                logger.info(f"Found {len(modals)} visible modal/overlay element(s)")
+                # Try to click outside
+                await self.page.mouse.click(10, 10)
+                logger.info("Clicked outside modal to dismiss it")
+                await self._wait_hidden(modals[0])
+        except Exception as e:
+            logger.debug(f"Error handling modals: {str(e)}")
 
     async def check_for_upload_dialog(self):
         """Check if the file upload dialog is visible"""
         logger.info("Checking for file upload dialog...")
-        await self.page.screenshot(path="before_upload_dialog_check.png")
+        await self._debug_screenshot("before_upload_dialog_check.png")
         
         # First, check if we're on a page that might contain a file upload
         current_url = self.page.url
         logger.info(f"Current URL while checking for upload dialog: {current_url}")
         
-        # Wait a bit longer for the dialog to appear
-        await asyncio.sleep(3)
+        # Give the dialog up to 3 seconds to appear
+        await self._wait_until_ready(UPLOAD_ELEMENTS, timeout=3000)
         
-        upload_selectors = [
-            'input[type="file"]',
-            '.file-upload',
-            '.upload-area',
-            '[data-testid="file-upload"]',
-            'div:has-text("Upload File")',
-            'div:has-text("Choose File")',
-            'div:has-text("Select File")',
-            'div:has-text("Drag and drop")',
-            'div[role="dialog"]', # General dialog check
-            'div.modal',          # Modal check
-            'div.file-input',
-            'input[accept=".csv"]'
-        ]
-        
-        for selector in upload_selectors:
-            try:
-                element = await self.page.query_selector(selector)
-                if element and await element.is_visible():
-                    logger.info(f"Found file upload element with selector: {selector}")
-                    
-                    # Take a screenshot of the found element
-                    safe_selector = selector.replace(':', '_').replace('[', '_').replace(']', '_').replace('"', '_').replace('*', '_').replace('=', '_')
-                    await element.screenshot(path=f"found_upload_element_{safe_selector}.png")
-                    return True
-            except Exception as e:
-                logger.debug(f"Error checking selector {selector}: {str(e)}")
+        try:
+            upload_elements = await self._visible_matches(UPLOAD_ELEMENTS_VISIBLE)
+            if upload_elements:
+                logger.info(f"Found {len(upload_elements)} visible file upload element(s)")
+                
+                # Take a screenshot of the first one found
+                if self.debug_screens:
+                    await upload_elements[0].screenshot(path="found_upload_element.png")
+                return True
+        except Exception as e:
+            logger.debug(f"Error checking upload selectors: {str(e)}")
         
         # Try using JavaScript to find an upload dialog or file input
         logger.info("Using JavaScript to look for file input elements")
         has_file_input = await self.page.evaluate('''() => {
             // Look for file inputs
-            const fileInputs = document.querySelectorAll('input[type="file"]');
-            console.log(`Found ${fileInputs.length} file inputs`);
-            
-            if (fileInputs.length > 0) {
+            if (document.querySelector('input[type="file"]')) {
                 return true;
             }
             
             // Look for elements with certain attributes
-            const possibleFileElements = document.querySelectorAll('[accept], [type="file"], [class*="upload"], [class*="file"], [id*="upload"], [id*="file"], [aria-label*="upload"], [aria-label*="file"]');
-            console.log(`Found ${possibleFileElements.length} possible file-related elements`);
+            if (document.querySelector('[accept], [class*="upload"], [class*="file"], [id*="upload"], [id*="file"], [aria-label*="upload" i], [aria-label*="file" i]')) {
+                return true;
+            }
             
             // Look for text indicating file upload
-            const bodyText = document.body.innerText.toLowerCase();
-            const hasUploadText = bodyText.includes('upload') || 
-                                 bodyText.includes('choose file') || 
-                                 bodyText.includes('select file') || 
-                                 bodyText.includes('drag and drop') ||
-                                 bodyText.includes('import file') ||
-                                 bodyText.includes('browse');
-                                 
-            console.log(`Page ${hasUploadText ? 'contains' : 'does not contain'} upload-related text`);
-            
-            // Take all text nodes and print them for debugging
-            const textNodes = [];
-            document.querySelectorAll('*').forEach(el => {
-                if (el.childNodes && 
-                    el.childNodes.length === 1 && 
-                    el.childNodes[0].nodeType === Node.TEXT_NODE &&
-                    el.childNodes[0].textContent.trim()) {
-                    textNodes.push(el.childNodes[0].textContent.trim());
-                }
-            });
-            
-            console.log("Text nodes on page:", textNodes.slice(0, 20)); // Log first 20 text nodes
-            
-            return possibleFileElements.length > 0 || hasUploadText;
+            return /upload|choose file|select file|drag and drop|import file|browse/.test(document.body.innerText.toLowerCase());
         }''')
         
         if has_file_input:
             logger.info("JavaScript found potential file upload elements")
             
             # Take a full page screenshot
-            await self.page.screenshot(path="js_found_upload_elements.png")
+            await self._debug_screenshot("js_found_upload_elements.png")
             return True
                 
         logger.info("No file upload dialog detected")
@@ -468,14 +907,22 @@ class PropStreamPlaywrightScraper:
     async def import_file(self, file_path):
         """Import a file to PropStream and create a new group"""
         logger.info(f"Importing file: {file_path}")
+        
+        # One group name with a timestamp for uniqueness, shared by every upload path below
+        group_name = f"Foreclosures_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        
+        # Remember the upload request the import dialog sends, for the direct upload fallback. The page is
+        # kept so the listener comes off it even if a re-login replaces self.page mid-import
+        listened_page = self.page
+        listened_page.on("request", self._record_upload_request)
         try:
             # Navigate directly to the contacts page
             logger.info("Navigating directly to contacts page to find the Import button")
-            await self.page.goto(f"{self.base_url}/contact", wait_until="networkidle")
-            await asyncio.sleep(3)
+            await self.page.goto(f"{self.base_url}/contact", wait_until="domcontentloaded")
+            await self._wait_until_ready(CONTACTS_READY_SELECTOR)
             
             # Take a screenshot of the contacts page
-            await self.page.screenshot(path="contacts_page_direct.png")
+            await self._debug_screenshot("contacts_page_direct.png")
             
             # Debug: Get page title and URL to understand where we are
             current_url = self.page.url
@@ -492,11 +939,11 @@ class PropStreamPlaywrightScraper:
                     
                 # Try navigating to contacts page again after re-login
                 logger.info("Re-navigating to contacts page after login")
-                await self.page.goto(f"{self.base_url}/contact", wait_until="networkidle")
-                await asyncio.sleep(3)
+                await self.page.goto(f"{self.base_url}/contact", wait_until="domcontentloaded")
+                await self._wait_until_ready(CONTACTS_READY_SELECTOR)
                 
                 # Take another screenshot to verify
-                await self.page.screenshot(path="contacts_page_after_relogin.png")
+                await self._debug_screenshot("contacts_page_after_relogin.png")
                 
                 # Double-check URL again
                 current_url = self.page.url
@@ -511,10 +958,23 @@ class PropStreamPlaywrightScraper:
             logger.info("Looking for import-related buttons on the page")
             
             # First, take a screenshot of the whole page
-            await self.page.screenshot(path="contacts_page_before_searching.png")
+            await self._debug_screenshot("contacts_page_before_searching.png")
+            
+            # Import or Upload options that should show up after clicking a menu or action button
+            import_option_selectors = [
+                'li:has-text("Import")',
+                'div:text-is("Import")',
+                'a:has-text("Import")',
+                'button:has-text("Import")',
+                'li:has-text("Upload")',
+                'div:text-is("Upload")',
+                'a:has-text("Upload")',
+                'button:has-text("Upload")',
+                '[data-testid*="import"]',
+                '[data-testid*="upload"]'
+            ]
             
             # Look for a menu button or dropdown that might contain the Import option
-            menu_button_found = False
             menu_button_selectors = [
                 'button.menu',
                 'button.dropdown',
@@ -531,25 +991,7 @@ class PropStreamPlaywrightScraper:
                 '[data-testid="options"]'
             ]
             
-            for selector in menu_button_selectors:
-                try:
-                    menu_buttons = await self.page.query_selector_all(selector)
-                    for button in menu_buttons:
-                        if await button.is_visible():
-                            logger.info(f"Found potential menu button with selector: {selector}")
-                            await button.click()
-                            menu_button_found = True
-                            logger.info("Clicked menu button")
-                            await asyncio.sleep(2)
-                            await self.page.screenshot(path="after_menu_button_click.png")
-                            break
-                    if menu_button_found:
-                        break
-                except Exception as e:
-                    logger.debug(f"Error with menu selector {selector}: {str(e)}")
-            
             # Look for action buttons and icons that might be Add/Import buttons
-            action_button_found = False
             action_button_selectors = [
                 'button:has-text("+")',
                 'button[aria-label="Add"]',
@@ -565,76 +1007,70 @@ class PropStreamPlaywrightScraper:
                 'div[role="button"]:has-text("+")'
             ]
             
-            for selector in action_button_selectors:
+            # Race the three kinds of controls and start from whichever shows up first;
+            # when an import option is already on screen the menu and action steps are skipped
+            first_visible_family = await self._race_visible({
+                "import": import_option_selectors,
+                "menu": menu_button_selectors,
+                "action": action_button_selectors
+            })
+            logger.info(f"First visible import control: {first_visible_family or 'none'}")
+            
+            if first_visible_family != "import":
                 try:
-                    action_buttons = await self.page.query_selector_all(selector)
-                    for button in action_buttons:
-                        if await button.is_visible():
-                            logger.info(f"Found potential add/action button with selector: {selector}")
-                            await button.click()
-                            action_button_found = True
-                            logger.info("Clicked add/action button")
-                            await asyncio.sleep(2)
-                            await self.page.screenshot(path="after_action_button_click.png")
-                            break
-                    if action_button_found:
-                        break
+                    selector, button = await self._first_visible(menu_button_selectors)
+                    if button:
+                        logger.info(f"Found potential menu button with selector: {selector}")
+                        await button.click()
+                        logger.info("Clicked menu button")
+                        await self._wait_until_ready(", ".join(import_option_selectors), timeout=2000)
+                        await self._debug_screenshot("after_menu_button_click.png")
                 except Exception as e:
-                    logger.debug(f"Error with action selector {selector}: {str(e)}")
-            
-            # After clicking menu or action buttons, try to find Import or Upload options
-            import_option_found = False
-            import_option_selectors = [
-                'li:has-text("Import")',
-                'div:has-text("Import")',
-                'a:has-text("Import")',
-                'button:has-text("Import")',
-                'li:has-text("Upload")',
-                'div:has-text("Upload")',
-                'a:has-text("Upload")',
-                'button:has-text("Upload")',
-                '[data-testid*="import"]',
-                '[data-testid*="upload"]'
-            ]
-            
-            for selector in import_option_selectors:
+                    logger.debug(f"Error with menu selectors: {str(e)}")
+                
                 try:
-                    import_options = await self.page.query_selector_all(selector)
-                    for option in import_options:
-                        if await option.is_visible():
-                            logger.info(f"Found potential import option with selector: {selector}")
-                            await option.click()
-                            import_option_found = True
-                            logger.info("Clicked import option")
-                            await asyncio.sleep(3)
-                            await self.page.screenshot(path="after_import_option_click.png")
-                            break
-                    if import_option_found:
-                        break
+                    selector, button = await self._first_visible(action_button_selectors)
+                    if button:
+                        logger.info(f"Found potential add/action button with selector: {selector}")
+                        await button.click()
+                        logger.info("Clicked add/action button")
+                        await self._wait_until_ready(", ".join(import_option_selectors), timeout=2000)
+                        await self._debug_screenshot("after_action_button_click.png")
                 except Exception as e:
-                    logger.debug(f"Error with import option selector {selector}: {str(e)}")
+                    logger.debug(f"Error with action selectors: {str(e)}")
+            
+            # After clicking menu or action buttons, try to find Import or Upload options
+            try:
+                selector, option = await self._first_visible(import_option_selectors)
+                if option:
+                    logger.info(f"Found potential import option with selector: {selector}")
+                    await option.click()
+                    logger.info("Clicked import option")
+                    await self._debug_screenshot("after_import_option_click.png")
+            except Exception as e:
+                logger.debug(f"Error with import option selectors: {str(e)}")
             
-            # Check for the upload dialog immediately after clicking any of these options
+            # Check for the upload dialog after clicking any of these options (waits for it to appear)
             upload_dialog_visible = await self.check_for_upload_dialog()
             
             # If we found the dialog, proceed with upload
             if upload_dialog_visible:
                 logger.info("Successfully found file upload dialog")
                 
-                # Wait a bit to let the dialog fully appear
-                await asyncio.sleep(2)
-                
-                # Look for the file input element
-                file_input = await self.page.query_selector('input[type="file"]')
+                # Look for the file input element, which is often hidden behind a styled drop zone
+                try:
+                    file_input = await self.page.wait_for_selector('input[type="file"]', state="attached", timeout=2000)
+                except TimeoutError:
+                    file_input = None
                 
                 if file_input:
                     # Use the file input to upload the file
                     logger.info(f"Uploading file: {file_path}")
-                    await file_input.set_input_files(file_path)
+                    await self._set_file_input(file_input, file_path)
                     
                     # Wait for the file to be processed
-                    await asyncio.sleep(5)
-                    await self.page.screenshot(path="after_file_upload.png")
+                    await self._wait_for_dom(text_pattern=UPLOAD_PROCESSED_TEXT, button_pattern=UPLOAD_PROCESSED_BUTTON_TEXT, timeout=5000)
+                    await self._debug_screenshot("after_file_upload.png")
                     
                     # Look for and click any "Continue" or "Next" buttons
                     continue_button_selectors = [
@@ -646,27 +1082,21 @@ class PropStreamPlaywrightScraper:
                         'button[type="submit"]'
                     ]
                     
-                    for selector in continue_button_selectors:
-                        try:
-                            continue_button = await self.page.query_selector(selector)
-                            if continue_button and await continue_button.is_visible():
-                                logger.info(f"Found continue button with selector: {selector}")
-                                await continue_button.click()
-                                logger.info("Clicked continue button")
-                                await asyncio.sleep(3)
-                                await self.page.screenshot(path="after_continue_click.png")
-                                break
-                        except Exception as e:
-                            logger.debug(f"Error with continue button selector {selector}: {str(e)}")
+                    try:
+                        selector, continue_button = await self._first_visible(continue_button_selectors)
+                        if continue_button:
+                            logger.info(f"Found continue button with selector: {selector}")
+                            await continue_button.click()
+                            logger.info("Clicked continue button")
+                            await self._wait_hidden(continue_button)
+                            await self._debug_screenshot("after_continue_click.png")
+                    except Exception as e:
+                        logger.debug(f"Error with continue button selectors: {str(e)}")
                     
                     # Now check for the group creation dialog
                     group_dialog_found = await self.check_for_group_dialog()
                     
                     if group_dialog_found:
-                        # Generate a group name with timestamp for uniqueness
-                        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                        group_name = f"Foreclosures_{timestamp}"
-                        
                         # Fill in the group name
                         group_name_filled = await self.fill_group_name(group_name)
                         
@@ -679,7 +1109,7 @@ class PropStreamPlaywrightScraper:
                                 await self.wait_for_import_completion()
                                 
                                 # Save the group name for later use
-                                self.group_name = group_name
+                                self._set_group_name(group_name)
                                 logger.info(f"Group created with name: {group_name}")
                                 
                                 return group_name
@@ -695,6 +1125,18 @@ class PropStreamPlaywrightScraper:
                 logger.error("Could not find file upload dialog after clicking import options")
             
             # If we get here, we've tried various methods but haven't succeeded
+            # If an earlier run recorded the upload endpoint, post the file to it directly
+            response = await self.upload_file_via_api(file_path)
+            if response:
+                # The group dialog is UI-only, so only a group the server reports back can be used later
+                uploaded_group = await self._group_name_from_response(response)
+                if uploaded_group:
+                    self._set_group_name(uploaded_group)
+                    logger.info(f"File uploaded directly into group: {uploaded_group}")
+                    return uploaded_group
+                logger.error("File uploaded directly but the response names no group, aborting import")
+                return None
+            
             # Let's try direct navigation to import URLs as a last resort
             potential_urls = [
                 f"{self.base_url}/contact/import",
@@ -703,12 +1145,13 @@ class PropStreamPlaywrightScraper:
                 f"{self.base_url}/upload"
             ]
             
-            for url in potential_urls:
+            # Probe every URL at once in its own tab and continue with the first one that has a file input
+            url = await self._find_import_url(potential_urls)
+            if url:
                 logger.info(f"Trying direct navigation to {url}")
                 try:
-                    await self.page.goto(url, wait_until="networkidle")
-                    await asyncio.sleep(3)
-                    await self.page.screenshot(path=f"direct_url_{url.split('/')[-1]}.png")
+                    await self.page.goto(url, wait_until="domcontentloaded")
+                    await self._debug_screenshot(f"direct_url_{url.split('/')[-1]}.png")
                     
                     # Check if this URL has a file input
                     if await self.check_for_upload_dialog():
@@ -718,26 +1161,22 @@ class PropStreamPlaywrightScraper:
                         file_input = await self.page.query_selector('input[type="file"]')
                         if file_input:
                             logger.info(f"Uploading file through direct URL: {file_path}")
-                            await file_input.set_input_files(file_path)
-                            await asyncio.sleep(5)
-                            await self.page.screenshot(path=f"file_uploaded_at_{url.split('/')[-1]}.png")
+                            await self._set_file_input(file_input, file_path)
+                            await self._wait_for_dom(text_pattern=UPLOAD_PROCESSED_TEXT, button_pattern=UPLOAD_PROCESSED_BUTTON_TEXT, timeout=5000)
+                            await self._debug_screenshot(f"file_uploaded_at_{url.split('/')[-1]}.png")
                             
                             # Rest of the import process...
-                            # Generate a unique group name
-                            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                            group_name = f"Foreclosures_{timestamp}"
-                            
                             # Try to find group creation options
                             if await self.check_for_group_dialog():
                                 if await self.fill_group_name(group_name) and await self.click_save_button():
                                     await self.wait_for_import_completion()
-                                    self.group_name = group_name
+                                    self._set_group_name(group_name)
                                     logger.info(f"Group created with name: {group_name}")
                                     return group_name
                             
                             # Even if we can't complete the full flow, return the group name
                             # in case it was created automatically
-                            self.group_name = group_name
+                            self._set_group_name(group_name)
                             return group_name
                     
                 except Exception as e:
@@ -747,57 +1186,160 @@ class PropStreamPlaywrightScraper:
             return None
             
         except Exception as e:
-            logger.error(f"Error importing file: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
-            await self.page.screenshot(path="import_error.png")
+            logger.exception(f"Error importing file: {str(e)}")
+            await self._error_screenshot("import_error.jpg")
             return None
+        finally:
+            listened_page.remove_listener("request", self._record_upload_request)
+    
+    async def _set_file_input(self, file_input, file_path):
+        """Attach a file to the given file input with CDP DOM.setFileInputFiles
+        
+        This skips Playwright's actionability checks. The input is tagged through its handle so CDP
+        resolves that exact node rather than the first file input in the document. It falls back to
+        set_input_files when attached over --cdp-endpoint, since that browser may not share this
+        machine's filesystem, or when the node can't be resolved or the CDP call fails.
+        """
+        if not self.cdp_endpoint:
+            cdp = None
+            try:
+                await file_input.evaluate("el => { el.dataset.propstreamUpload = '1'; }")
+                cdp = await self.context.new_cdp_session(self.page)
+                result = await cdp.send("Runtime.evaluate", {"expression": "document.querySelector('[data-propstream-upload]')"})
+                object_id = result.get("result", {}).get("objectId")
+                if object_id:
+                    await cdp.send("DOM.setFileInputFiles", {"files": [os.path.abspath(file_path)], "objectId": object_id})
+                    return
+            except Error as e:
+                logger.debug(f"CDP file upload failed, using set_input_files: {str(e)}")
+            finally:
+                try:
+                    await file_input.evaluate("el => { delete el.dataset.propstreamUpload; }")
+                except Error:
+                    pass
+                if cdp:
+                    try:
+                        await cdp.detach()
+                    except Error:
+                        pass
+        await file_input.set_input_files(file_path)
+    
+    async def _probe_import_url(self, url):
+        """Open url in a new tab of the logged-in context and return it if the page has a file input"""
+        page = await self.context.new_page()
+        try:
+            await page.route("**/*", self._route_request)
+            await page.goto(url, wait_until="domcontentloaded")
+            # File inputs are usually hidden, so wait for one to be attached rather than visible
+            await page.wait_for_selector('input[type="file"]', state="attached", timeout=3000)
+            return url
+        except (TimeoutError, Error):
+            logger.info(f"No file input at {url}")
+            return None
+        finally:
+            await page.close()
+    
+    async def _find_import_url(self, urls):
+        """Probe candidate import URLs in parallel and return the first that has a file input"""
+        pending = {asyncio.create_task(self._probe_import_url(url)) for url in urls}
+        found = None
+        try:
+            while pending and not found:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                found = next((task.result() for task in done if task.result()), None)
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        return found
+    
+    def _record_upload_request(self, request):
+        """Save the URL, form field and headers of a multipart file upload POST"""
+        if request.method != "POST" or not any(word in request.url.lower() for word in ("import", "upload")):
+            return
+        try:
+            match = UPLOAD_FIELD_PATTERN.search(request.post_data_buffer or b"")
+            if not match:
+                return
+            
+            # Cookies come from the context, the multipart boundary changes per request,
+            # and auth/CSRF tokens would be stale on replay, so none of them are saved to disk
+            headers = {name: value for name, value in request.headers.items()
+                       if name.lower() not in UPLOAD_SKIPPED_HEADERS and not UPLOAD_CREDENTIAL_HEADER.search(name)}
+            with open(UPLOAD_ENDPOINT_PATH, 'wb') as f:
+                f.write(orjson.dumps({"url": request.url, "field": match.group(1).decode(), "headers": headers}))
+            logger.info(f"Recorded file upload endpoint: {request.url}")
+        except Exception as e:
+            logger.debug(f"Could not record upload request: {str(e)}")
+    
+    def _set_group_name(self, group_name):
+        """Remember the imported group's name, and its prefix for the CSV filenames"""
+        self.group_name = group_name
+        self.group_prefix = group_name.split('_', 1)[0]
+    
+    async def upload_file_via_api(self, file_path):
+        """Post the file straight to the upload endpoint recorded from an earlier UI upload
+        
+        Returns the successful response, or None.
+        """
+        if not os.path.exists(UPLOAD_ENDPOINT_PATH):
+            return None
+        
+        try:
+            with open(UPLOAD_ENDPOINT_PATH, 'rb') as f:
+                endpoint = orjson.loads(f.read())
+            with open(file_path, 'rb') as f:
+                file_bytes = f.read()
+            
+            logger.info(f"Uploading file directly to {endpoint['url']}")
+            response = await self.context.request.post(
+                endpoint["url"],
+                headers=endpoint["headers"],
+                multipart={
+                    endpoint["field"]: {
+                        "name": os.path.basename(file_path),
+                        "mimeType": "text/csv",
+                        "buffer": file_bytes
+                    }
+                }
+            )
+            logger.info(f"Direct upload response: {response.status}")
+            return response if response.ok else None
+        except Exception as e:
+            logger.warning(f"Direct upload failed: {str(e)}")
+            return None
+    
+    async def _group_name_from_response(self, response):
+        """Return the group name from a direct upload's JSON response, or None if it has none"""
+        try:
+            data = orjson.loads(await response.body())
+        except (Error, orjson.JSONDecodeError) as e:
+            logger.debug(f"Upload response is not JSON: {str(e)}")
+            return None
+        if isinstance(data, dict):
+            data = data.get("group", data)
+        if not isinstance(data, dict):
+            return None
+        return next((data[key] for key in UPLOAD_GROUP_NAME_KEYS if isinstance(data.get(key), str) and data[key]), None)
     
     async def check_for_group_dialog(self):
         """Check if the group creation dialog is visible"""
         logger.info("Checking for group creation dialog")
-        await self.page.screenshot(path="before_group_dialog_check.png")
-        
-        # Wait a bit for the dialog to appear
-        await asyncio.sleep(2)
+        await self._debug_screenshot("before_group_dialog_check.png")
         
-        group_dialog_selectors = [
-            'div:has-text("Create New Group")',
-            'div:has-text("Add to Group")',
-            'div:has-text("Select Group")',
-            'div:has-text("Group Name")',
-            'input[placeholder*="group" i]',
-            'input[placeholder*="name" i]',
-            'input.new-group-input',
-            'input[name="groupName"]',
-            'div.group-selection',
-            'div.group-creation',
-            'div[role="dialog"]',
-            'div.modal'
-        ]
+        # Give the dialog up to 2 seconds to appear
+        await self._wait_for_dom(GROUP_DIALOG_CSS, text_pattern=GROUP_DIALOG_TEXT, timeout=2000)
         
-        for selector in group_dialog_selectors:
-            try:
-                element = await self.page.query_selector(selector)
-                if element and await element.is_visible():
-                    logger.info(f"Found group dialog element with selector: {selector}")
-                    return True
-            except Exception as e:
-                logger.debug(f"Error checking selector {selector}: {str(e)}")
-        
-        # Use JavaScript to look for group dialog indicators
-        js_found_group_dialog = await self.page.evaluate('''() => {
-            const bodyText = document.body.innerText.toLowerCase();
-            return bodyText.includes('create new group') || 
-                   bodyText.includes('add to group') || 
-                   bodyText.includes('select group') || 
-                   bodyText.includes('group name');
-        }''')
+        # Dialog elements and page text indicators are checked together in one query
+        try:
+            matches = await self._visible_matches(GROUP_DIALOG_ELEMENTS_VISIBLE)
+            if matches:
+                logger.info(f"Found {len(matches)} visible group dialog indicator(s)")
+                return True
+        except Exception as e:
+            logger.debug(f"Error checking group dialog selectors: {str(e)}")
         
-        if js_found_group_dialog:
-            logger.info("JavaScript found text indicating group dialog")
-            return True
-            
         logger.info("No group creation dialog found")
         return False
     
@@ -812,125 +1354,93 @@ class PropStreamPlaywrightScraper:
     async def select_create_new_option(self):
         """Select the 'Create New' radio option"""
         logger.info("Looking for 'Create New' radio option")
-        create_new_selectors = [
-            'input[value="new"]',
-            'label:has-text("Create New")',
-            'div:has-text("Create New") input',
-            'input#create-new',
-            'input[name="groupRadio"][value="new"]',
-            'input[type="radio"]:below(label:has-text("Create New"))',
-            'input[type="radio"]:near(:text("Create New"))',
-            'label:has-text("Create New") input'
-        ]
         
         create_new_selected = False
-        for selector in create_new_selectors:
-            try:
-                element = await self.page.query_selector(selector)
-                if element:
-                    logger.info(f"Found 'Create New' radio button with selector: {selector}")
-                    await element.click(timeout=5000)
-                    create_new_selected = True
-                    logger.info(f"Selected 'Create New' using selector: {selector}")
-                    await asyncio.sleep(1)
-                    await self.page.screenshot(path="after_create_new_selected.png")
-                    break
-            except Exception as e:
-                logger.debug(f"Could not click 'Create New' with selector {selector}: {str(e)}")
+        try:
+            selector, element = await self._first_visible(CREATE_NEW_SELECTORS, cache_key="create_new")
+            if element:
+                logger.info(f"Found 'Create New' radio button with selector: {selector}")
+                await element.click(timeout=5000)
+                create_new_selected = True
+                logger.info(f"Selected 'Create New' using selector: {selector}")
+                await self._wait_until_ready(GROUP_NAME_INPUTS, timeout=1000)
+                await self._debug_screenshot("after_create_new_selected.png")
+        except Exception as e:
+            logger.debug(f"Could not click 'Create New': {str(e)}")
         
         # If we couldn't find the selector, try examining all radio buttons
         if not create_new_selected:
             logger.info("Trying to find 'Create New' by examining all radio buttons")
             
-            # List all radio buttons
-            radio_buttons = await self.page.query_selector_all('input[type="radio"]')
-            logger.info(f"Found {len(radio_buttons)} radio buttons on the page")
+            # Read the label of every visible radio button in one call
+            radio_selector = 'input[type="radio"]:visible'
+            label_texts = await self.page.eval_on_selector_all(radio_selector, '''els => els.map(e => {
+                const label = e.id && document.querySelector(`label[for="${CSS.escape(e.id)}"]`);
+                return label ? label.innerText : null;
+            })''')
+            logger.info(f"Found {len(label_texts)} visible radio buttons on the page")
             
-            for i, radio in enumerate(radio_buttons):
-                try:
-                    # Check if it's visible
-                    if not await radio.is_visible():
-                        continue
-                        
-                    # Try to get the label or text near this radio
-                    radio_id = await radio.get_attribute('id')
-                    if radio_id:
-                        label_selector = f'label[for="{radio_id}"]'
-                        label = await self.page.query_selector(label_selector)
-                        if label:
-                            label_text = await label.inner_text()
-                            logger.info(f"Radio {i+1} has label: '{label_text}'")
-                            
-                            if "create" in label_text.lower() or "new" in label_text.lower():
-                                logger.info(f"Clicking radio with label: '{label_text}'")
-                                await radio.click()
-                                create_new_selected = True
-                                await asyncio.sleep(1)
-                                await self.page.screenshot(path="after_radio_click.png")
-                                break
-                except Exception as e:
-                    logger.debug(f"Error examining radio button {i+1}: {str(e)}")
+            for i, label_text in enumerate(label_texts):
+                if label_text is None:
+                    continue
+                logger.debug("Radio %d has label: '%s'", i + 1, label_text)
+                
+                if "create" in label_text.lower() or "new" in label_text.lower():
+                    try:
+                        logger.info(f"Clicking radio with label: '{label_text}'")
+                        await self.page.locator(radio_selector).nth(i).click()
+                        create_new_selected = True
+                        await self._wait_until_ready(GROUP_NAME_INPUTS, timeout=1000)
+                        await self._debug_screenshot("after_radio_click.png")
+                        break
+                    except Exception as e:
+                        logger.debug(f"Error clicking radio button {i+1}: {str(e)}")
         
         return create_new_selected
     
     async def fill_group_name(self, group_name):
         """Fill in the group name input field"""
         logger.info(f"Trying to fill group name: {group_name}")
-        group_input_selectors = [
-            'input[placeholder="New Group"]',
-            'input[placeholder*="group" i]',
-            'input[placeholder*="name" i]',
-            'input.new-group-input',
-            'input[name="groupName"]',
-            'input[id*="group" i][type="text"]',
-            'input[id*="name" i][type="text"]',
-            'input[type="text"]:near(:text("Group"))',
-            'input[type="text"]:near(:text("Name"))'
-        ]
-        
         group_input_found = False
-        for selector in group_input_selectors:
-            try:
-                element = await self.page.query_selector(selector)
-                if element and await element.is_visible():
-                    logger.info(f"Found group name input with selector: {selector}")
-                    await element.fill(group_name)
-                    logger.info(f"Set group name to: {group_name}")
-                    group_input_found = True
-                    await asyncio.sleep(1)
-                    await self.page.screenshot(path="after_group_name_filled.png")
-                    break
-            except Exception as e:
-                logger.debug(f"Error with selector {selector}: {str(e)}")
+        try:
+            selector, element = await self._first_visible(GROUP_NAME_INPUT_SELECTORS, cache_key="group_name_input")
+            if element:
+                logger.info(f"Found group name input with selector: {selector}")
+                await element.fill(group_name)
+                logger.info(f"Set group name to: {group_name}")
+                group_input_found = True
+                await self._wait_for_value(element)
+                await self._debug_screenshot("after_group_name_filled.png")
+        except Exception as e:
+            logger.debug(f"Error filling group name input: {str(e)}")
         
         if not group_input_found:
             # As a fallback, try to find any visible text input on the page
             logger.info("Looking for any text input fields")
-            inputs = await self.page.query_selector_all('input[type="text"]:visible')
-            logger.info(f"Found {len(inputs)} visible text inputs")
+            input_selector = 'input[type="text"]:visible'
+            # Attributes that might indicate the group name input, read for every input in one call
+            attributes = await self.page.eval_on_selector_all(
+                input_selector,
+                "els => els.map(e => [e.getAttribute('placeholder') || '', e.getAttribute('name') || '', e.id || ''])"
+            )
+            logger.info(f"Found {len(attributes)} visible text inputs")
             
             # Try each visible text input
-            for i, input_elem in enumerate(inputs):
+            for i, (placeholder, name, id) in enumerate(attributes):
                 try:
-                    # Check attributes that might indicate this is the group name input
-                    placeholder = await input_elem.get_attribute('placeholder') or ""
-                    name = await input_elem.get_attribute('name') or ""
-                    id = await input_elem.get_attribute('id') or ""
-                    
-                    logger.info(f"Text input {i+1}: placeholder='{placeholder}', name='{name}', id='{id}'")
+                    logger.debug("Text input %d: placeholder='%s', name='%s', id='%s'", i + 1, placeholder, name, id)
                     
                     # Skip inputs that are clearly not for group name
-                    if any(word in (placeholder + name + id).lower() for word in [
-                        "search", "filter", "email", "password", "phone", "address"
-                    ]):
+                    if NOT_GROUP_NAME_FIELD.search(placeholder + name + id):
                         continue
                     
                     # Try to fill this input
+                    input_elem = await self.page.locator(input_selector).nth(i).element_handle()
                     await input_elem.fill(group_name)
                     logger.info(f"Filled potential group name input {i+1} with: {group_name}")
                     group_input_found = True
-                    await asyncio.sleep(1)
-                    await self.page.screenshot(path=f"after_filling_input_{i+1}.png")
+                    await self._wait_for_value(input_elem)
+                    await self._debug_screenshot(f"after_filling_input_{i+1}.png")
                     break
                 except Exception as e:
                     logger.debug(f"Error examining input {i+1}: {str(e)}")
@@ -940,74 +1450,59 @@ class PropStreamPlaywrightScraper:
     async def click_save_button(self):
         """Find and click the save/continue/import button"""
         logger.info("Looking for Save/Submit/Import button")
-        save_button_selectors = [
-            'button[type="submit"]',
-            'button:has-text("Save")',
-            'button:has-text("Submit")',
-            'button:has-text("Import")',
-            'button:has-text("Continue")',
-            'button:has-text("Next")',
-            'button:has-text("Done")',
-            '.save-button',
-            '[data-testid="save-button"]',
-            '[data-testid="submit-button"]',
-            '[data-testid="continue-button"]',
-            'div[role="button"]:has-text("Save")',
-            'div[role="button"]:has-text("Submit")',
-            'div[role="button"]:has-text("Import")',
-            'div[role="button"]:has-text("Continue")',
-            'div[role="button"]:has-text("Next")'
-        ]
         
         save_clicked = False
-        for selector in save_button_selectors:
-            try:
-                elements = await self.page.query_selector_all(selector)
-                for element in elements:
-                    if await element.is_visible():
-                        button_text = await element.inner_text()
-                        logger.info(f"Found potential save button: '{button_text}'")
+        
+        # One batched query rules out the case where no candidate is visible at all
+        if await self._visible_matches(SAVE_BUTTONS_VISIBLE):
+            for selector in self._cached_first("save_button", SAVE_BUTTON_SELECTORS):
+                try:
+                    # Read the text of every visible match in one call instead of per element
+                    visible_selector = f"{selector}:visible"
+                    button_texts = await self.page.eval_on_selector_all(visible_selector, 'els => els.map(e => e.innerText)')
+                    for i, button_text in enumerate(button_texts):
+                        logger.debug("Found potential save button: '%s'", button_text)
                         
                         # Skip if it contains text suggesting it's not what we want
-                        if any(word in button_text.lower() for word in ["cancel", "back", "close"]):
+                        if NOT_SAVE_BUTTON_TEXT.search(button_text):
                             continue
-                            
+                        
+                        element = await self.page.locator(visible_selector).nth(i).element_handle()
                         await element.click(timeout=5000)
                         save_clicked = True
+                        self._selector_hit_cache["save_button"] = selector
                         logger.info(f"Clicked button with text: '{button_text}'")
-                        await asyncio.sleep(1)
-                        await self.page.screenshot(path="after_save_click.png")
+                        await self._wait_hidden(element, timeout=1000)
+                        await self._debug_screenshot("after_save_click.png")
                         break
-                
-                if save_clicked:
-                    break
-            except Exception as e:
-                logger.debug(f"Could not click with selector {selector}: {str(e)}")
+                    
+                    if save_clicked:
+                        break
+                except Exception as e:
+                    logger.debug(f"Could not click with selector {selector}: {str(e)}")
         
         if not save_clicked:
             # Try to find any button that might be the save button
             logger.info("Looking for any button that might confirm the operation")
-            buttons = await self.page.query_selector_all('button:visible, div[role="button"]:visible')
-            logger.info(f"Found {len(buttons)} visible buttons")
+            button_selector = 'button:visible, div[role="button"]:visible'
+            # Read every button's text in one call, then fetch only the one that gets clicked
+            button_texts = await self.page.eval_on_selector_all(button_selector, 'els => els.map(e => e.innerText)')
+            logger.info(f"Found {len(button_texts)} visible buttons")
             
-            for i, button in enumerate(buttons):
-                try:
-                    button_text = await button.inner_text()
-                    logger.info(f"Button {i+1} text: '{button_text}'")
-                    
-                    if any(keyword in button_text.lower() for keyword in [
-                        "save", "done", "submit", "import", "ok", "continue", "next", "create"
-                    ]) and not any(keyword in button_text.lower() for keyword in [
-                        "cancel", "back", "close"
-                    ]):
+            for i, button_text in enumerate(button_texts):
+                logger.debug("Button %d text: '%s'", i + 1, button_text)
+                
+                if SAVE_BUTTON_TEXT.search(button_text) and not NOT_SAVE_BUTTON_TEXT.search(button_text):
+                    try:
                         logger.info(f"Clicking button {i+1} with text: '{button_text}'")
+                        button = await self.page.locator(button_selector).nth(i).element_handle()
                         await button.click()
                         save_clicked = True
-                        await asyncio.sleep(1)
-                        await self.page.screenshot(path=f"after_clicking_button_{i+1}.png")
+                        await self._wait_hidden(button, timeout=1000)
+                        await self._debug_screenshot(f"after_clicking_button_{i+1}.png")
                         break
-                except Exception as e:
-                    logger.debug(f"Error examining button {i+1}: {str(e)}")
+                    except Exception as e:
+                        logger.debug(f"Error clicking button {i+1}: {str(e)}")
         
         return save_clicked
     
@@ -1015,35 +1510,22 @@ class PropStreamPlaywrightScraper:
         """Wait for the import process to complete"""
         logger.info("Waiting for import to complete...")
         
-        # Take screenshots at intervals to track progress
-        for i in range(1, 7):
-            await asyncio.sleep(5)
-            await self.page.screenshot(path=f"import_progress_{i}.png")
-            
-            # Check for completion indicators
-            completion_indicators = [
-                'div:text("Import completed")',
-                'div:text("Import successful")',
-                'div:text("Group created")',
-                '.success-message',
-                '[data-testid="import-success"]'
-            ]
-            
-            for selector in completion_indicators:
-                try:
-                    element = await self.page.query_selector(selector)
-                    if element and await element.is_visible():
-                        message = await element.inner_text()
-                        logger.info(f"Found import completion message: '{message}'")
-                        return True
-                except Exception:
-                    continue
-            
-            # Check URL for indication we've returned to the contacts page
-            if "/contact" in self.page.url and not "/import" in self.page.url:
-                logger.info("Returned to contacts page, which suggests import completed")
-                return True
-                
+        # A completion message and a return to the contacts page are both checked in one in-page
+        # condition, re-evaluated every 250ms for up to 30 seconds. The text pattern is compiled
+        # once per page and cached on window rather than rebuilt on every poll
+        try:
+            await self.page.wait_for_function('''([sels, textSource]) => {
+                const text = window.__propstreamImportText || (window.__propstreamImportText = new RegExp(textSource, 'i'));
+                return sels.some(s => document.querySelector(s)) ||
+                    (document.body && text.test(document.body.innerText)) ||
+                    (location.pathname.includes('/contact') && !location.pathname.includes('/import'));
+            }''',
+                arg=[IMPORT_COMPLETION_CSS, IMPORT_COMPLETION_TEXT], polling=250, timeout=30000)
+            logger.info(f"Import completion detected at {self.page.url}")
+            return True
+        except (TimeoutError, Error) as e:
+            logger.debug(f"Import completion wait ended: {str(e)}")
+        
         logger.warning("Did not find explicit import completion message, but continuing")
         return False
     
@@ -1060,7 +1542,7 @@ class PropStreamPlaywrightScraper:
             return True
         except Exception as e:
             logger.error(f"Error navigating to skip tracing: {str(e)}")
-            await self.page.screenshot(path="skip_tracing_nav_error.png")
+            await self._error_screenshot("skip_tracing_nav_error.jpg")
             return False
     
     async def select_contacts_for_skip_tracing(self):
@@ -1071,48 +1553,32 @@ class PropStreamPlaywrightScraper:
             await self.page.click('div.src-components-Button-style__FABy8__content:text("Select Contacts")')
             
             # Wait for the dropdown to appear
-            await self.page.wait_for_selector('select.src-components-base-Dropdown-style__X5sdo__control')
+            dropdown_selector = 'select.src-components-base-Dropdown-style__X5sdo__control'
+            await self.page.wait_for_selector(dropdown_selector)
+            
+            # Read the text and value of every option in one call
+            options = await self.page.eval_on_selector_all('option', 'els => els.map(e => [e.innerText, e.value])')
             
             # Find the option that contains our group name
-            dropdown = await self.page.query_selector('select.src-components-base-Dropdown-style__X5sdo__control')
-            
-            # Click to open the dropdown
-            await dropdown.click()
-            
-            # Find the option that matches our group name (or partial match)
-            options = await self.page.query_selector_all('option')
-            target_option = None
-            
-            for option in options:
-                option_text = await option.inner_text()
-                # Check if our group name is contained in the option text
-                if self.group_name in option_text:
-                    target_option = option
-                    option_value = await option.get_attribute('value')
-                    logger.info(f"Found our group in dropdown: {option_text} with value {option_value}")
-                    break
+            target_option = next((option for option in options if self.group_name in option[0]), None)
+            if target_option:
+                logger.info(f"Found our group in dropdown: {target_option[0]} with value {target_option[1]}")
+            else:
+                # No exact match, try to find the closest match
+                parts = self.group_name.split('_')
+                if len(parts) > 1:
+                    target_option = next((option for option in options
+                                          if parts[0] in option[0] and parts[1] in option[0]), None)
+                if target_option:
+                    logger.info(f"Found similar group in dropdown: {target_option[0]} with value {target_option[1]}")
             
             # If we found our option, select it
             if target_option:
-                await target_option.click()
+                await self.page.select_option(dropdown_selector, value=target_option[1])
                 logger.info(f"Selected group from dropdown")
             else:
-                # No exact match, try to find the closest match
-                for option in options:
-                    option_text = await option.inner_text()
-                    parts = self.group_name.split('_')
-                    if parts[0] in option_text and parts[1] in option_text:
-                        target_option = option
-                        option_value = await option.get_attribute('value')
-                        logger.info(f"Found similar group in dropdown: {option_text} with value {option_value}")
-                        break
-                
-                if target_option:
-                    await target_option.click()
-                    logger.info(f"Selected similar group from dropdown")
-                else:
-                    logger.error("Could not find our group in the dropdown")
-                    return False
+                logger.error("Could not find our group in the dropdown")
+                return False
             
             # Wait for contacts to load
             await asyncio.sleep(2)
@@ -1125,12 +1591,13 @@ class PropStreamPlaywrightScraper:
                     await header_checkbox.click()
                     logger.info("Clicked header checkbox to select all contacts")
                 else:
-                    # If no header checkbox, try to click individual checkboxes
-                    checkboxes = await self.page.query_selector_all('div.ag-checkbox-input')
-                    if checkboxes:
-                        for checkbox in checkboxes:
-                            await checkbox.click()
-                        logger.info(f"Clicked {len(checkboxes)} individual checkboxes")
+                    # If no header checkbox, click every unchecked row checkbox inside the page in one call
+                    clicked = await self.page.eval_on_selector_all(
+                        'div.ag-checkbox-input',
+                        'els => els.filter(e => !e.checked).map(e => HTMLElement.prototype.click.call(e)).length'
+                    )
+                    if clicked:
+                        logger.info(f"Clicked {clicked} individual checkboxes")
                     else:
                         logger.warning("No checkboxes found, but continuing")
             except Exception as e:
@@ -1149,7 +1616,7 @@ class PropStreamPlaywrightScraper:
             return True
         except Exception as e:
             logger.error(f"Error selecting contacts for skip tracing: {str(e)}")
-            await self.page.screenshot(path="select_contacts_error.png")
+            await self._error_screenshot("select_contacts_error.jpg")
             return False
     
     async def place_skip_tracing_order(self):
@@ -1206,64 +1673,66 @@ class PropStreamPlaywrightScraper:
             
         except Exception as e:
             logger.error(f"Error placing skip tracing order: {str(e)}")
-            await self.page.screenshot(path="place_order_error.png")
+            await self._error_screenshot("place_order_error.jpg")
             return None
     
     async def wait_for_order_completion(self, max_retries=12, wait_interval=30):
         """Wait for the skip tracing order to complete"""
         logger.info("Waiting for skip tracing order to complete...")
+        self._job_selected = False
         
         for attempt in range(max_retries):
             logger.info(f"Check attempt {attempt+1}/{max_retries}")
             
             try:
-                # Navigate to contacts page
-                await self.page.goto(f"{self.base_url}/contact", wait_until="networkidle")
+                # Load the contacts page once, then just reload it so the app's scripts stay cached and warm,
+                # waiting for the sidebar instead of network idle
+                skip_trace_selector = 'div.src-app-components-ToggleList-style__cNA8V__name:has-text("Skip Tracing")'
+                if attempt > 0 and self.page.url.startswith(f"{self.base_url}/contact"):
+                    await self.page.reload(wait_until="domcontentloaded")
+                else:
+                    await self.page.goto(f"{self.base_url}/contact", wait_until="domcontentloaded")
+                await self._wait_until_ready(skip_trace_selector, timeout=10000)
                 
                 # Look for completion indicators
-                skip_trace_section = await self.page.query_selector('div.src-app-components-ToggleList-style__cNA8V__name:has-text("Skip Tracing")')
+                skip_trace_section = await self.page.query_selector(skip_trace_selector)
                 
                 if skip_trace_section:
                     logger.info("Found Skip Tracing section in sidebar")
                     
                     # Wait for the job to appear in the list
                     logger.info(f"Looking for job with name: {self.skip_trace_list_name}")
-                    list_name_elements = await self.page.query_selector_all('div.src-app-components-ToggleList-style__tt0fX__labelName')
+                    job = self._sidebar_job()
                     
-                    # Check each job name for a match
-                    for element in list_name_elements:
-                        job_name = await element.inner_text()
-                        logger.info(f"Found job: {job_name}")
+                    if await job.count():
+                        logger.info(f"Found our skip tracing job: {self.skip_trace_list_name}")
                         
-                        if job_name == self.skip_trace_list_name:
-                            logger.info(f"Found our skip tracing job: {job_name}")
-                            
-                            # Check if this job has completed by looking at neighboring elements
-                            parent = await element.query_selector('xpath=..')
-                            if parent:
-                                # Try to see if there's a quantity indicator
-                                quantity_element = await parent.query_selector('div.src-app-components-ToggleList-style__orTGe__labelQuantity')
-                                if quantity_element:
-                                    quantity_text = await quantity_element.inner_text()
-                                    logger.info(f"Job has quantity indicator: {quantity_text}")
-                                    
-                                    # If we see a number in parentheses, that likely means the job has contacts
-                                    if '(' in quantity_text and ')' in quantity_text:
-                                        logger.info("Order appears to be complete based on contact count")
-                                        return True
-                            
-                            # Even if we can't confirm completion, try clicking on the job
-                            await element.click()
-                            logger.info(f"Clicked on job: {job_name}")
-                            
-                            # Wait for the contact data to load
-                            await asyncio.sleep(5)
+                        # Check if this job has completed by looking for a quantity indicator next to it
+                        quantity_element = job.locator('xpath=..').locator(SIDEBAR_JOB_QUANTITY_SELECTOR).first
+                        if await quantity_element.count():
+                            quantity_text = await quantity_element.inner_text()
+                            logger.info(f"Job has quantity indicator: {quantity_text}")
                             
-                            # Look for indicators that data has loaded
-                            grid_loaded = await self.page.query_selector('div.ag-center-cols-container')
-                            if grid_loaded:
-                                logger.info("Contact grid is loaded, assuming order is complete")
+                            # If we see a number in parentheses, that likely means the job has contacts
+                            if JOB_COUNT_PATTERN.search(quantity_text):
+                                logger.info("Order appears to be complete based on contact count")
                                 return True
+                        
+                        # Even if we can't confirm completion, try clicking on the job
+                        await self._mark_grid_rows()
+                        await job.click(timeout=5000)
+                        logger.info(f"Clicked on job: {self.skip_trace_list_name}")
+                        
+                        # Wait for the job's contacts to replace the rows already in the grid
+                        await self._wait_grid(replaced=True)
+                        
+                        # Look for indicators that data has loaded
+                        grid_loaded = await self.page.query_selector('div.ag-center-cols-container')
+                        if grid_loaded:
+                            logger.info("Contact grid is loaded, assuming order is complete")
+                            # The grid now shows this job, so extraction doesn't need to open it again
+                            self._job_selected = True
+                            return True
                     
                     logger.info(f"Job not found or not complete yet. Waiting {wait_interval} seconds before next check...")
                 else:
@@ -1272,12 +1741,65 @@ class PropStreamPlaywrightScraper:
             except Exception as e:
                 logger.error(f"Error checking order status: {str(e)}")
             
-            # Wait before next check
-            await asyncio.sleep(wait_interval)
+            # Watch the sidebar until the next check instead of sleeping, so a live update ends the wait at once
+            if await self._wait_for_job_quantity(wait_interval * 1000):
+                logger.info("Order appears to be complete based on contact count")
+                return True
         
         logger.warning(f"Max retries ({max_retries}) reached. Assuming order is complete and continuing.")
         return True
     
+    def _sidebar_job(self):
+        """Locator for the sidebar entry whose name is exactly the skip tracing list name"""
+        name = re.compile(f"^{re.escape(self.skip_trace_list_name or '')}$")
+        return self.page.locator(SIDEBAR_JOB_NAME_SELECTOR).filter(has_text=name).first
+    
+    async def _mark_grid_rows(self):
+        """Tag the grid's current rows so _wait_grid(replaced=True) can tell when a new list has replaced them"""
+        try:
+            await self.page.eval_on_selector_all(GRID_ROW_SELECTOR, "rows => rows.forEach(row => { row.dataset.propstreamStale = '1'; })")
+        except Error as e:
+            logger.debug(f"Could not mark the grid rows: {str(e)}")
+    
+    async def _wait_grid(self, timeout=10000, replaced=False):
+        """Wait until the page has loaded and the contacts grid's rows have stopped changing, returning False on timeout
+        
+        With replaced=True, also wait until none of the rows tagged by _mark_grid_rows are left.
+        """
+        try:
+            # The row count and first row must match over three 100ms polls before the grid counts as rendered
+            await self.page.evaluate("() => { delete window.__propstreamGridWait; }")
+            await self.page.wait_for_function(
+                """([selector, replaced]) => {
+                    const rows = document.querySelectorAll(selector);
+                    const state = window.__propstreamGridWait || (window.__propstreamGridWait = {key: null, polls: 0});
+                    if (document.readyState !== 'complete' || !rows.length ||
+                            (replaced && [...rows].some(row => row.dataset.propstreamStale))) {
+                        state.key = null;
+                        state.polls = 0;
+                        return false;
+                    }
+                    const key = rows.length + '|' + rows[0].textContent;
+                    state.polls = key === state.key ? state.polls + 1 : 0;
+                    state.key = key;
+                    return state.polls >= 2;
+                }""",
+                arg=[GRID_ROW_SELECTOR, replaced], polling=100, timeout=timeout
+            )
+            return True
+        except (TimeoutError, Error):
+            logger.debug(f"Contacts grid rows did not settle after {timeout}ms")
+            return False
+    
+    async def _wait_for_job_quantity(self, timeout):
+        """Wait for the skip tracing job in the sidebar to show a contact count, returning False on timeout"""
+        quantity = self._sidebar_job().locator('xpath=..').locator(SIDEBAR_JOB_QUANTITY_SELECTOR).first
+        try:
+            await expect(quantity).to_have_text(JOB_COUNT_PATTERN, timeout=timeout)
+            return True
+        except (AssertionError, Error):
+            return False
+    
     async def extract_skip_traced_data(self):
         """Extract the skip traced contact data"""
         logger.info("Extracting skip traced data")
@@ -1285,119 +1807,162 @@ class PropStreamPlaywrightScraper:
         try:
             # Make sure we're on the contacts page showing our skip traced list
             if self.skip_trace_list_name:
-                # Navigate to contacts page
-                await self.page.goto(f"{self.base_url}/contact", wait_until="networkidle")
-                
-                # Find and click on our skip trace job in the left sidebar
-                list_name_elements = await self.page.query_selector_all('div.src-app-components-ToggleList-style__tt0fX__labelName')
-                job_clicked = False
+                # Navigate to contacts page unless wait_for_order_completion left us there, and wait for
+                # the sidebar's job names instead of network idle
+                if self.page.url.split('?')[0].rstrip('/') != f"{self.base_url}/contact":
+                    await self.page.goto(f"{self.base_url}/contact", wait_until="domcontentloaded")
+                    self._job_selected = False
+                await self._wait_until_ready(SIDEBAR_JOB_NAME_SELECTOR, timeout=10000)
                 
-                for element in list_name_elements:
-                    job_name = await element.inner_text()
-                    if job_name == self.skip_trace_list_name:
-                        await element.click()
-                        job_clicked = True
-                        logger.info(f"Clicked on job: {job_name}")
-                        break
-                
-                if not job_clicked:
+                # Find and click on our skip trace job in the left sidebar, unless wait_for_order_completion
+                # already opened it, in which case the grid only needs to settle
+                job = self._sidebar_job()
+                if not await job.count():
                     logger.warning(f"Could not find job with name: {self.skip_trace_list_name}")
                     return False
                 
-                # Wait for the grid to load
-                await asyncio.sleep(5)
+                if self._job_selected:
+                    logger.info(f"Job already selected: {self.skip_trace_list_name}")
+                    await self._wait_grid()
+                else:
+                    await self._mark_grid_rows()
+                    await job.click(timeout=5000)
+                    logger.info(f"Clicked on job: {self.skip_trace_list_name}")
+                    
+                    # Wait for the job's contacts to replace the rows already in the grid
+                    await self._wait_grid(replaced=True)
             
             # Extract data from the contacts grid
             logger.info("Extracting contact data from grid")
             
-            # Get all rows in the grid
-            rows = await self.page.query_selector_all('div.ag-row')
-            logger.info(f"Found {len(rows)} contact rows")
-            
-            extracted_data = []
-            
-            for row_index, row in enumerate(rows):
-                logger.info(f"Processing row {row_index+1}")
-                
-                # Extract name
-                name_cell = await row.query_selector('[col-id="name"]')
-                name = await name_cell.inner_text() if name_cell else f"Contact {row_index+1}"
-                
-                # Extract mobile phone
-                mobile_cell = await row.query_selector('[id^="cell-mobilePhone-"]')
-                mobile_phone = await mobile_cell.inner_text() if mobile_cell else ""
-                
-                # Extract landline phone
-                landline_cell = await row.query_selector('[id^="cell-landlinePhone-"]')
-                landline_phone = await landline_cell.inner_text() if landline_cell else ""
-                
-                # Extract other phone (based on selector provided)
-                other_phone_cell = await row.query_selector(':nth-child(4)')
-                other_phone = await other_phone_cell.inner_text() if other_phone_cell else ""
-                
-                # Extract email
-                email_cell = await row.query_selector(':nth-child(5)')
-                email = await email_cell.inner_text() if email_cell else ""
-                
-                # Store the extracted data
-                contact_data = {
-                    'Name': name,
-                    'Mobile Phone': mobile_phone,
-                    'Landline': landline_phone,
-                    'Phone': other_phone,
-                    'Email': email
-                }
-                
-                extracted_data.append(contact_data)
-                logger.info(f"Extracted data for contact: {name}")
+            # The grid only renders the rows in view, so read the full row model from its API when reachable
+            extracted_data = await self._read_grid_row_model()
+            source = "grid row model"
+            if extracted_data is None:
+                extracted_data = await self._read_rendered_rows()
+                source = "rendered grid rows"
             
             self.extracted_data = extracted_data
-            logger.info(f"Extracted data for {len(extracted_data)} contacts")
+            logger.info(f"Extracted data for {len(extracted_data)} contacts from the {source}")
             
             return len(extracted_data) > 0
             
         except Exception as e:
             logger.error(f"Error extracting skip traced data: {str(e)}")
-            await self.page.screenshot(path="extract_data_error.png")
+            await self._error_screenshot("extract_data_error.jpg")
             return False
     
+    async def _read_grid_row_model(self):
+        """Return every contact in the AG Grid row model, or None if the grid API is not reachable"""
+        try:
+            records = await self.page.evaluate('''() => {
+                const root = document.querySelector('.ag-root-wrapper');
+                const options = root && root.__agComponent && root.__agComponent.gridOptions;
+                const api = options && options.api;
+                if (!api || typeof api.forEachNode !== 'function') {
+                    return null;
+                }
+                const records = [];
+                api.forEachNode(node => {
+                    if (node.data) {
+                        records.push(node.data);
+                    }
+                });
+                return records;
+            }''')
+        except Error as e:
+            logger.debug(f"Could not read the grid row model: {str(e)}")
+            return None
+        if not records:
+            return None
+        
+        # Fall back to the rendered rows unless the records have a key for every field, so a model
+        # without the phone columns can't silently export empty phones
+        keys = [next((key for key in field_keys if key in records[0]), None) for _, field_keys in GRID_MODEL_FIELDS]
+        if None in keys:
+            logger.debug(f"Grid row model lacks keys for some fields, found: {list(records[0])}")
+            return None
+        
+        extracted_data = []
+        for i, record in enumerate(records):
+            values = [self._grid_cell_value(record.get(key)) for key in keys]
+            contact = Contact(*values)
+            extracted_data.append(contact if contact.name else contact._replace(name=f"Contact {i+1}"))
+        return extracted_data
+    
+    @staticmethod
+    def _grid_cell_value(value):
+        """Format a row model value as CSV cell text, matching what the rendered-rows path reads"""
+        if value is None:
+            return ""
+        if isinstance(value, (dict, list)):
+            # Nested values are written as JSON rather than as Python reprs
+            return orjson.dumps(value).decode()
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        return str(value).strip()
+    
+    async def _read_rendered_rows(self):
+        """Return the contacts in the grid rows currently rendered in the page"""
+        # Read every row's cells inside the page in one call instead of a query and inner_text per cell.
+        # textContent is used since, unlike innerText, it does not force a layout for every cell
+        rows = await self.page.eval_on_selector_all(GRID_ROW_SELECTOR, '''(rows, cells) => rows.map((row, i) =>
+            cells.map(([field, selectors]) => {
+                let cell = null;
+                for (const selector of selectors) {
+                    if ((cell = row.querySelector(selector))) {
+                        break;
+                    }
+                }
+                return cell ? cell.textContent.trim() : (field === 'Name' ? `Contact ${i + 1}` : '');
+            })
+        )''', GRID_CELL_SELECTORS)
+        return [Contact(*row) for row in rows]
+    
+    @staticmethod
+    def _write_csv(output_file, contacts):
+        """Write contacts to a CSV file and return how many of them have a phone number"""
+        # Contacts are already tuples in column order, so they go to the C csv writer as they are
+        contacts_with_phones = sum(1 for contact in contacts if contact.mobile_phone or contact.landline or contact.phone)
+        
+        # Quote the whole file in memory, then encode and write it in one call
+        buffer = io.StringIO(newline='')
+        writer = csv.writer(buffer)
+        writer.writerow(CSV_FIELDNAMES)
+        writer.writerows(contacts)
+        with open(output_file, 'wb') as csvfile:
+            csvfile.write(buffer.getvalue().encode('utf-8'))
+        return contacts_with_phones
+    
     async def save_data_to_csv(self, output_file=None):
         """Save extracted data to CSV file"""
         if not self.extracted_data:
             logger.warning("No data to save")
             return None
             
+        # The backup filename uses these even when output_file is given
+        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        group_prefix = getattr(self, 'group_prefix', "PropStream")
         if not output_file:
             # Generate filename with timestamp
-            timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-            group_prefix = self.group_name.split('_')[0] if hasattr(self, 'group_name') else "PropStream"
             output_file = f"{group_prefix}_skip_traced_{timestamp}.csv"
         
         try:
-            with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = ['Name', 'Mobile Phone', 'Landline', 'Phone', 'Email']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                
-                writer.writeheader()
-                for contact in self.extracted_data:
-                    writer.writerow(contact)
-            
+            # File writes block, so run them in a worker thread to keep the browser connection serviced
+            contacts_with_phones = await asyncio.to_thread(self._write_csv, output_file, self.extracted_data)
             logger.info(f"Saved {len(self.extracted_data)} contacts to {output_file}")
             
-            # Create a backup with more detailed filename
-            contacts_with_phones = sum(1 for c in self.extracted_data if any([
-                c.get('Mobile Phone'), c.get('Landline'), c.get('Phone')
-            ]))
+            # A backup is only worth keeping when skip tracing found phone numbers
+            if not contacts_with_phones:
+                logger.warning("No contacts have phone numbers, skipping the backup file")
+                return output_file
             
+            # Create a backup with more detailed filename
             backup_file = f"skip_traced_{group_prefix}_{contacts_with_phones}_phones_{len(self.extracted_data)}_total_{timestamp}.csv"
             
-            with open(backup_file, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = ['Name', 'Mobile Phone', 'Landline', 'Phone', 'Email']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                
-                writer.writeheader()
-                for contact in self.extracted_data:
-                    writer.writerow(contact)
+            # Copy rather than hard-link: a later run writing the same output file truncates it in place,
+            # which would also overwrite a linked backup
+            await asyncio.to_thread(shutil.copyfile, output_file, backup_file)
             
             logger.info(f"Created backup file: {backup_file}")
             
@@ -1407,36 +1972,42 @@ class PropStreamPlaywrightScraper:
             return None
     
     async def close(self):
-        """Close browser and clean up"""
+        """Close browser and clean up (a shared CDP browser is only disconnected from, not shut down)"""
         if self.browser:
             await self.browser.close()
             logger.info("Browser closed")
         else:
             logger.info("No browser instance to close")
+        
+        if self.playwright and self._owns_playwright:
+            await self.playwright.stop()
+            self.playwright = None
     
-    async def run(self, file_path, output_file=None, headless=False, use_mock=False):
+    async def run(self, file_path, output_file=None, headless=True, use_mock=False, cdp_endpoint=None, playwright=None, debug=False):
         """Run the full process"""
         try:
             # Initialize browser only if not in mock mode
             if not use_mock:
-                await self.setup_browser(headless=headless, use_mock=use_mock)
+                await self.setup_browser(headless=headless, use_mock=use_mock, cdp_endpoint=cdp_endpoint, playwright=playwright, debug=debug)
                 
-                # Login
-                if not await self.login(use_mock=use_mock):
+                # Reuse the saved session if it is still valid, otherwise login
+                if os.path.exists(self.storage_state_path) and await self.is_logged_in():
+                    logger.info("Reusing saved session, skipping login")
+                elif not await self.login(use_mock=use_mock):
                     logger.error("Login failed, aborting")
                     return False
             
             if use_mock:
                 logger.info("Using mock workflow for testing purposes")
                 # Create a mock group and skip trace job
-                self.group_name = f"Test_Group_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+                self._set_group_name(f"Test_Group_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
                 self.skip_trace_list_name = f"Skip_Trace_{datetime.now().strftime('%m/%d/%Y - %H%M%S')}"
                 
                 # Create mock data
                 self.extracted_data = [
-                    {'Name': 'John Doe', 'Mobile Phone': '(555) 123-4567', 'Landline': '(555) 765-4321', 'Phone': '', 'Email': 'john@example.com'},
-                    {'Name': 'Jane Smith', 'Mobile Phone': '(555) 987-6543', 'Landline': '', 'Phone': '(555) 567-8901', 'Email': 'jane@example.com'},
-                    {'Name': 'Bob Johnson', 'Mobile Phone': '(555) 234-5678', 'Landline': '(555) 876-5432', 'Phone': '', 'Email': 'bob@example.com'}
+                    Contact('John Doe', '(555) 123-4567', '(555) 765-4321', '', 'john@example.com'),
+                    Contact('Jane Smith', '(555) 987-6543', '', '(555) 567-8901', 'jane@example.com'),
+                    Contact('Bob Johnson', '(555) 234-5678', '(555) 876-5432', '', 'bob@example.com')
                 ]
                 
                 # Save mock data to CSV
@@ -1491,7 +2062,7 @@ class PropStreamPlaywrightScraper:
         except Exception as e:
             logger.error(f"Error during process: {str(e)}")
             if self.page and not use_mock:
-                await self.page.screenshot(path="error.png")
+                await self._error_screenshot("error.jpg")
             return False
             
         finally:
@@ -1502,8 +2073,11 @@ class PropStreamPlaywrightScraper:
 async def main():
     parser = argparse.ArgumentParser(description='PropStream Playwright Scraper')
     parser.add_argument('--mock', action='store_true', help='Use mock workflow for testing')
-    parser.add_argument('--headless', action='store_true', help='Run in headless mode')
+    parser.add_argument('--headless', action='store_true', help='Run in headless mode (the default)')
+    parser.add_argument('--headed', action='store_true', help='Show the browser window')
+    parser.add_argument('--debug', action='store_true', help='Slow down a headed browser and disable web security checks for troubleshooting')
     parser.add_argument('--file', type=str, default="foreclosures_processed.csv", help='CSV file to upload')
+    parser.add_argument('--cdp-endpoint', type=str, default=None, help='Connect to a running Chromium (e.g. http://localhost:9222) instead of launching one')
     args = parser.parse_args()
     
     # Your PropStream credentials
@@ -1516,8 +2090,10 @@ async def main():
     # Run the scraper with configuration options
     await scraper.run(
         file_path=args.file, 
-        headless=args.headless,
-        use_mock=args.mock
+        headless=not args.headed,
+        use_mock=args.mock,
+        cdp_endpoint=args.cdp_endpoint,
+        debug=args.debug
     )
 
 if __name__ == "__main__":